@@ -1,23 +1,34 @@
 from __future__ import annotations
 
+import io
+import json
+import os
+import re
 import shutil
-import subprocess
+import stat
 import sys
 import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, time as dt_time
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Callable, List, Optional
+from typing import Callable, Deque, Iterator, List, Optional
 import tkinter as tk
 from tkinter import messagebox, ttk
 
 from .calendar_tab import CalendarTab
-from .contact_tab import ContactTab
 from .database import Database
-from .log_tab import LogTab
-from .scrum_tab import ScrumTab
 from .system_notifications import SystemNotifier
 from .notifications import NotificationManager, NotificationPayload
-from .environment import APP_NAME, ensure_user_data_dir, legacy_project_root
+from .environment import (
+    APP_NAME,
+    ensure_user_data_dir,
+    legacy_project_root,
+    mark_legacy_migration_done,
+    mark_legacy_migration_pending,
+)
 from .settings_store import AppSettings, JiraSettings, load_settings, save_settings
 from .settings_tab import SettingsTab
 from .special_features import (
@@ -41,6 +52,201 @@ from .version import __version__
 from . import updater
 from . import utils
 from .theme import ThemePalette, get_theme, THEMES
+
+
+# Shared fonts for ttk styles and the app-level popups.
+FONT_FAMILY = "Segoe UI"
+FONT_BODY = (FONT_FAMILY, 10)
+FONT_BODY_BOLD = (FONT_FAMILY, 10, "bold")
+FONT_LARGE = (FONT_FAMILY, 11)
+FONT_LARGE_BOLD = (FONT_FAMILY, 11, "bold")
+FONT_SUBHEADING = (FONT_FAMILY, 12, "bold")
+FONT_HEADING = (FONT_FAMILY, 14, "bold")
+
+_NOTIFICATION_WRAP = 280
+_PROGRESS_WRAP = 320
+
+StyleSpec = tuple[str, dict[str, object], dict[str, list]]
+
+
+def build_style_specs(palette: ThemePalette) -> list[StyleSpec]:
+    """Return the ttk style table for ``palette`` as (name, configure, map) entries."""
+    return [
+        ("TFrame", {"background": palette.surface_bg}, {}),
+        ("TNotebook", {"background": palette.window_bg, "borderwidth": 0}, {}),
+        (
+            "TNotebook.Tab",
+            {"background": palette.surface_alt_bg, "foreground": palette.text_secondary, "padding": (16, 4)},
+            {
+                "background": [("selected", palette.card_alt_bg)],
+                "foreground": [("selected", palette.text_primary)],
+                "padding": [("selected", (16, 10))],
+            },
+        ),
+        ("TLabel", {"background": palette.surface_bg, "foreground": palette.text_primary, "font": FONT_BODY}, {}),
+        (
+            "CalendarHeading.TLabel",
+            {"font": FONT_HEADING, "foreground": palette.text_primary, "background": palette.surface_bg},
+            {},
+        ),
+        (
+            "SidebarHeading.TLabel",
+            {"font": FONT_SUBHEADING, "foreground": palette.accent, "background": palette.surface_bg},
+            {},
+        ),
+        (
+            "SelectedDay.TLabel",
+            {"font": FONT_LARGE, "foreground": palette.text_secondary, "background": palette.surface_bg},
+            {},
+        ),
+        (
+            "TButton",
+            {
+                "background": palette.list_alt_bg,
+                "foreground": palette.text_primary,
+                "padding": (12, 6),
+                "bordercolor": palette.border,
+            },
+            {"background": [("pressed", palette.list_selected_bg), ("active", palette.list_selected_bg)]},
+        ),
+        (
+            "SettingsTabInactive.TButton",
+            {
+                "background": palette.surface_alt_bg,
+                "foreground": palette.text_secondary,
+                "padding": (16, 4, 16, 4),
+                "relief": "raised",
+                "borderwidth": 1,
+            },
+            {"background": [("pressed", palette.card_alt_bg), ("active", palette.card_alt_bg)]},
+        ),
+        (
+            "SettingsTabActive.TButton",
+            {
+                "background": palette.card_alt_bg,
+                "foreground": palette.text_primary,
+                "padding": (16, 10, 16, 10),
+                "relief": "sunken",
+                "borderwidth": 1,
+            },
+            {"background": [("active", palette.card_alt_bg)]},
+        ),
+        (
+            "Treeview",
+            {
+                "background": palette.list_bg,
+                "fieldbackground": palette.list_bg,
+                "foreground": palette.text_primary,
+                "borderwidth": 0,
+                "font": FONT_BODY,
+            },
+            {
+                "background": [("selected", palette.list_selected_bg)],
+                "foreground": [("selected", palette.list_selected_fg)],
+            },
+        ),
+        (
+            "Treeview.Heading",
+            {
+                "background": palette.list_alt_bg,
+                "foreground": palette.text_secondary,
+                "font": FONT_BODY_BOLD,
+            },
+            {},
+        ),
+        (
+            "Danger.TButton",
+            {"background": palette.danger_bg, "foreground": palette.danger_fg, "padding": (12, 6)},
+            {"background": [("active", palette.danger_bg), ("pressed", palette.danger_bg)]},
+        ),
+        ("AppHidden.TNotebook", {"background": palette.window_bg, "borderwidth": 0, "tabmargins": 0}, {}),
+        (
+            "TabBar.TButton",
+            {
+                "background": palette.surface_alt_bg,
+                "foreground": palette.text_secondary,
+                "padding": (14, 6),
+                "bordercolor": palette.border,
+                "relief": "raised",
+                "borderwidth": 1,
+            },
+            {
+                "background": [("pressed", palette.card_alt_bg), ("active", palette.card_alt_bg)],
+                "foreground": [("pressed", palette.text_primary), ("active", palette.text_primary)],
+            },
+        ),
+        (
+            "TabBarActive.TButton",
+            {
+                "background": palette.card_alt_bg,
+                "foreground": palette.text_primary,
+                "padding": (16, 10),
+                "bordercolor": palette.border,
+                "relief": "raised",
+                "borderwidth": 1,
+            },
+            {"background": [("active", palette.card_alt_bg)]},
+        ),
+        (
+            "TabBarArrow.TButton",
+            {
+                "background": palette.surface_alt_bg,
+                "foreground": palette.text_secondary,
+                "padding": (8, 4),
+                "bordercolor": palette.border,
+            },
+            {
+                "background": [("pressed", palette.card_alt_bg), ("active", palette.card_alt_bg)],
+                "foreground": [("pressed", palette.text_primary), ("active", palette.text_primary)],
+            },
+        ),
+    ]
+
+
+def build_all_style_specs() -> dict[str, list[StyleSpec]]:
+    return {name: build_style_specs(palette) for name, palette in THEMES.items()}
+
+
+_STYLE_SPECS = build_all_style_specs()
+
+
+@lru_cache(maxsize=None)
+def _manages_shortcuts() -> bool:
+    """Shortcuts are only managed for the frozen Windows build."""
+    return sys.platform.startswith("win") and bool(getattr(sys, "frozen", False))
+
+
+@lru_cache(maxsize=None)
+def _target_executable() -> Path:
+    return Path(sys.executable).resolve()
+
+
+@lru_cache(maxsize=None)
+def _icon_candidates() -> tuple[Path, ...]:
+    """Bundled icon locations; these depend only on how the process was launched.
+
+    Built on first use rather than at import, so the startup handoff in
+    _ensure_installed_binary can avoid resolving sys.executable.
+    """
+    candidates: List[Path] = []
+    if hasattr(sys, "_MEIPASS"):
+        candidates.append(Path(sys._MEIPASS) / "personal_assistant.ico")
+    candidates.append(_target_executable().parent / "personal_assistant.ico")
+    candidates.append(Path(__file__).resolve().parent.parent / "assets" / "personal_assistant.ico")
+    return tuple(candidates)
+
+
+# Delay before pending settings changes are written to disk.
+_SETTINGS_FLUSH_DELAY_MS = 500
+
+# Maximum notification windows opened per Tk tick when draining a burst.
+_NOTIFICATION_DRAIN_BATCH = 8
+
+# Notification stack geometry, bottom-right corner of the screen.
+_NOTIFICATION_WIDTH = 320
+_NOTIFICATION_HEIGHT = 140
+_NOTIFICATION_GAP = 10
+_NOTIFICATION_PADDING = 20
 
 
 class PersonalAssistantApp(tk.Tk):
@@ -50,6 +256,8 @@ class PersonalAssistantApp(tk.Tk):
 
         screen_w = self.winfo_screenwidth()
         screen_h = self.winfo_screenheight()
+        self._screen_w = screen_w
+        self._screen_h = screen_h
         default_w = min(1380, max(1100, screen_w - 160))
         default_h = min(900, max(760, screen_h - 200))
         self.geometry(f"{default_w}x{default_h}")
@@ -63,18 +271,24 @@ class PersonalAssistantApp(tk.Tk):
         self.logs_dir.mkdir(parents=True, exist_ok=True)
         self.settings = settings
         self.settings_path = settings_path
+        self._settings_dirty = False
+        self._settings_flush_pending = False
         utils.set_use_24_hour_time(self.settings.use_24_hour_time)
         self._special_feature_keys = sanitize_special_feature_keys(self.settings.special_features)
         if self._special_feature_keys != self.settings.special_features:
             self.settings.special_features = self._special_feature_keys
-            save_settings(self.settings_path, self.settings)
+            self._mark_settings_dirty()
         self._special_tab_cache = {}
         self.theme_name = settings.theme if settings.theme in THEMES else "dark"
         self.theme: ThemePalette = get_theme(self.theme_name)
+        self._icon_path: Optional[Path] = None
         self._icon_path = self._ensure_icon_file()
         self.db = Database(db_path)
         self.system_notifier = SystemNotifier()
         self.configure(bg=self.theme.window_bg)
+        self._applied_styles: dict[str, tuple[dict[str, object], dict[str, list]]] = {}
+        self._style: Optional[ttk.Style] = None
+        self._styles_applied = False
         self._configure_styles(self.theme)
         self._apply_window_icon()
         self.jira_service = JiraService(
@@ -88,6 +302,10 @@ class PersonalAssistantApp(tk.Tk):
         self.notebook = ttk.Notebook(self.main_frame, style="AppHidden.TNotebook")
         self.notebook.pack(fill=tk.BOTH, expand=True)
 
+        self._shortcut_state: dict[str, Optional[bool]] = {"desktop": None, "start_menu": None}
+        # Bumped on every user toggle so a startup sync that finishes later
+        # does not overwrite the user's newer choice.
+        self._shortcut_generation: dict[str, int] = {"desktop": 0, "start_menu": 0}
         manage_shortcuts = self._should_manage_shortcut()
         self.settings_tab_frame = ttk.Frame(self.notebook, style="TFrame")
         self.settings_tab = SettingsTab(
@@ -115,16 +333,31 @@ class PersonalAssistantApp(tk.Tk):
         self.settings_tab.pack(fill=tk.BOTH, expand=True)
         self.settings_tab_frame.place_forget()
 
+        # The calendar is the default page and is built eagerly. The other core
+        # tabs start as empty placeholder pages and are built the first time
+        # they are selected (see _realize_selected_tab).
         self.calendar_tab = CalendarTab(self.notebook, self.db, self.theme)
-        self.scrum_tab = ScrumTab(self.notebook, self.db, self.theme)
-        self.log_tab = LogTab(self.notebook, self.db)
-        self.contact_tab = ContactTab(self.notebook, self.data_root, app_version=__version__)
+        self.log_tab = None
+        self.scrum_tab = None
+        self.contact_tab = None
+        self._core_tab_factories: dict[str, Callable[[tk.Misc], tk.Misc]] = {
+            "log": self._build_log_tab,
+            "scrum": self._build_scrum_tab,
+            "contact": self._build_contact_tab,
+        }
+        self._realized_tabs: dict[str, tk.Misc] = {"calendar": self.calendar_tab}
+        self._lazy_tab_keys: dict[str, str] = {}
+        core_pages: dict[str, tk.Misc] = {"calendar": self.calendar_tab}
+        for key in self._core_tab_factories:
+            page = ttk.Frame(self.notebook, style="TFrame")
+            self._lazy_tab_keys[str(page)] = key
+            core_pages[key] = page
 
         self._core_tabs = {
-            "calendar": (self.calendar_tab, "Production Calendar"),
-            "log": (self.log_tab, "Daily Update Log"),
-            "scrum": (self.scrum_tab, "Tasks Board"),
-            "contact": (self.contact_tab, "Contact Support"),
+            "calendar": (core_pages["calendar"], "Production Calendar"),
+            "log": (core_pages["log"], "Daily Update Log"),
+            "scrum": (core_pages["scrum"], "Tasks Board"),
+            "contact": (core_pages["contact"], "Contact Support"),
         }
         self._base_tab_order = ["calendar", "log", "scrum", "contact"]
         self._sync_notebook_tabs()
@@ -132,147 +365,56 @@ class PersonalAssistantApp(tk.Tk):
         self._last_notebook_tab = self.notebook.select()
         self._settings_visible = False
         self.notebook.bind("<<NotebookTabChanged>>", self._record_last_notebook_tab)
-        self.notebook.bind("<Configure>", self._position_settings_button)
-        self.after(50, self._position_settings_button)
+        self._notebook_geom: tuple[int, int] | None = None
+        self._reposition_after_id: Optional[str] = None
+        self.notebook.bind("<Configure>", self._schedule_settings_reposition)
         self._sync_settings_button_state()
 
         self.notifications: List[NotificationWindow] = []
+        self._notif_queue: Deque[NotificationPayload] = deque()
+        self._notif_drain_scheduled = False
         self.notification_manager = NotificationManager(self.db, self._handle_notification)
         start_time = self._coerce_time_to_dt(self.settings.daily_update_start, "08:00")
         end_time = self._coerce_time_to_dt(self.settings.daily_update_end, "17:00")
         self.notification_manager.configure_daily_log_hours(start_time, end_time)
         self.notification_manager.set_standing_reminders_enabled(self.settings.daily_update_notifications)
-        self.after(1000, self.notification_manager.start)
-        self.after(2000, self._check_for_updates_async)
-        self.after(250, self._ensure_shortcuts)
+        # Local work only; network calls (update check, download) run on daemon
+        # threads so closing the window never waits on them.
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="PA-bg")
+        self._update_prompt_open = False
+        self._update_install_started = False
+        self.after_idle(self._post_init_sequence)
 
         self.protocol("WM_DELETE_WINDOW", self.on_close)
 
     # ---------------------------------------------------------------- Styles
     def _configure_styles(self, palette: ThemePalette) -> None:
-        style = ttk.Style(self)
-        try:
-            style.theme_use("clam")
-        except tk.TclError:
-            pass
-
-        style.configure("TFrame", background=palette.surface_bg)
-        style.configure("TNotebook", background=palette.window_bg, borderwidth=0)
-        style.configure("TNotebook.Tab", background=palette.surface_alt_bg, foreground=palette.text_secondary, padding=(16, 4))
-        style.map(
-            "TNotebook.Tab",
-            background=[("selected", palette.card_alt_bg)],
-            foreground=[("selected", palette.text_primary)],
-            padding=[("selected", (16, 10))],
-        )
-        style.configure("TLabel", background=palette.surface_bg, foreground=palette.text_primary, font=("Segoe UI", 10))
-        style.configure("CalendarHeading.TLabel", font=("Segoe UI", 14, "bold"), foreground=palette.text_primary, background=palette.surface_bg)
-        style.configure("SidebarHeading.TLabel", font=("Segoe UI", 12, "bold"), foreground=palette.accent, background=palette.surface_bg)
-        style.configure("SelectedDay.TLabel", font=("Segoe UI", 11), foreground=palette.text_secondary, background=palette.surface_bg)
-        style.configure(
-            "TButton",
-            background=palette.list_alt_bg,
-            foreground=palette.text_primary,
-            padding=(12, 6),
-            bordercolor=palette.border,
-        )
-        style.map(
-            "TButton",
-            background=[("pressed", palette.list_selected_bg), ("active", palette.list_selected_bg)],
-        )
-        style.configure(
-            "SettingsTabInactive.TButton",
-            background=palette.surface_alt_bg,
-            foreground=palette.text_secondary,
-            padding=(16, 4, 16, 4),
-            relief="raised",
-            borderwidth=1,
-        )
-        style.map(
-            "SettingsTabInactive.TButton",
-            background=[("pressed", palette.card_alt_bg), ("active", palette.card_alt_bg)],
-        )
-        style.configure(
-            "SettingsTabActive.TButton",
-            background=palette.card_alt_bg,
-            foreground=palette.text_primary,
-            padding=(16, 10, 16, 10),
-            relief="sunken",
-            borderwidth=1,
-        )
-        style.map(
-            "SettingsTabActive.TButton",
-            background=[("active", palette.card_alt_bg)],
-        )
-        style.configure(
-            "Treeview",
-            background=palette.list_bg,
-            fieldbackground=palette.list_bg,
-            foreground=palette.text_primary,
-            borderwidth=0,
-            font=("Segoe UI", 10),
-        )
-        style.configure(
-            "Treeview.Heading",
-            background=palette.list_alt_bg,
-            foreground=palette.text_secondary,
-            font=("Segoe UI", 10, "bold"),
-        )
-        style.map("Treeview", background=[("selected", palette.list_selected_bg)], foreground=[("selected", palette.list_selected_fg)])
-        style.configure(
-            "Danger.TButton",
-            background=palette.danger_bg,
-            foreground=palette.danger_fg,
-            padding=(12, 6),
-        )
-        style.map(
-            "Danger.TButton",
-            background=[("active", palette.danger_bg), ("pressed", palette.danger_bg)],
-        )
-
-        style.layout("AppHidden.TNotebook", [("Notebook.client", {"sticky": "nswe"})])
-        style.layout("AppHidden.TNotebook.Tab", [])
-        style.configure("AppHidden.TNotebook", background=palette.window_bg, borderwidth=0, tabmargins=0)
-
-        style.configure(
-            "TabBar.TButton",
-            background=palette.surface_alt_bg,
-            foreground=palette.text_secondary,
-            padding=(14, 6),
-            bordercolor=palette.border,
-            relief="raised",
-            borderwidth=1,
-        )
-        style.map(
-            "TabBar.TButton",
-            background=[("pressed", palette.card_alt_bg), ("active", palette.card_alt_bg)],
-            foreground=[("pressed", palette.text_primary), ("active", palette.text_primary)],
-        )
-        style.configure(
-            "TabBarActive.TButton",
-            background=palette.card_alt_bg,
-            foreground=palette.text_primary,
-            padding=(16, 10),
-            bordercolor=palette.border,
-            relief="raised",
-            borderwidth=1,
-        )
-        style.map(
-            "TabBarActive.TButton",
-            background=[("active", palette.card_alt_bg)],
-        )
-        style.configure(
-            "TabBarArrow.TButton",
-            background=palette.surface_alt_bg,
-            foreground=palette.text_secondary,
-            padding=(8, 4),
-            bordercolor=palette.border,
-        )
-        style.map(
-            "TabBarArrow.TButton",
-            background=[("pressed", palette.card_alt_bg), ("active", palette.card_alt_bg)],
-            foreground=[("pressed", palette.text_primary), ("active", palette.text_primary)],
-        )
+        style = self._style
+        if style is None:
+            style = self._style = ttk.Style(self)
+        # The base theme and custom layouts are palette independent; set them
+        # once per interpreter and only replay the colour table on theme switches.
+        if not self._styles_applied:
+            try:
+                style.theme_use("clam")
+            except tk.TclError:
+                pass
+            style.layout("AppHidden.TNotebook", [("Notebook.client", {"sticky": "nswe"})])
+            style.layout("AppHidden.TNotebook.Tab", [])
+            self._styles_applied = True
+
+        specs = _STYLE_SPECS.get(palette.name)
+        if specs is None:
+            specs = build_style_specs(palette)
+        applied = self._applied_styles
+        for name, configure_kwargs, map_kwargs in specs:
+            # Only send Tcl commands for styles whose options actually changed.
+            previous_configure, previous_map = applied.get(name, ({}, {}))
+            if configure_kwargs and configure_kwargs != previous_configure:
+                style.configure(name, **configure_kwargs)
+            if map_kwargs and map_kwargs != previous_map:
+                style.map(name, **map_kwargs)
+            applied[name] = (configure_kwargs, map_kwargs)
 
     def _build_tab_bar(self, parent: tk.Misc) -> None:
         self.tabbar = ttk.Frame(parent, style="TFrame", padding=(0, 4, 0, 0))
@@ -284,7 +426,7 @@ class PersonalAssistantApp(tk.Tk):
             text="<",
             width=3,
             style="TabBarArrow.TButton",
-            command=lambda: self._scroll_tabs(-1),
+            command=partial(self._scroll_tabs, -1),
         )
         self.tabs_left_button.grid(row=0, column=0, padx=(6, 2), pady=4)
 
@@ -304,7 +446,7 @@ class PersonalAssistantApp(tk.Tk):
             text=">",
             width=3,
             style="TabBarArrow.TButton",
-            command=lambda: self._scroll_tabs(1),
+            command=partial(self._scroll_tabs, 1),
         )
         self.tabs_right_button.grid(row=0, column=2, padx=(2, 2), pady=4)
 
@@ -392,7 +534,7 @@ class PersonalAssistantApp(tk.Tk):
                 self.tabs_inner,
                 text=label,
                 style="TabBar.TButton",
-                command=lambda target=widget: self._select_tab(target),
+                command=partial(self._select_tab, widget),
             )
             btn.pack(side=tk.LEFT, padx=(0, 6), pady=(1, 0))
             self._tab_buttons[widget] = btn
@@ -408,11 +550,12 @@ class PersonalAssistantApp(tk.Tk):
         self._update_tab_button_styles()
         self._scroll_active_tab_into_view()
 
-    def _update_tab_button_styles(self) -> None:
+    def _update_tab_button_styles(self, current_id: Optional[str] = None) -> None:
         if not hasattr(self, "_tab_buttons"):
             return
         try:
-            current_id = self.notebook.select()
+            if current_id is None:
+                current_id = self.notebook.select()
             current_widget = self.nametowidget(current_id) if current_id else None
         except tk.TclError:
             current_widget = None
@@ -420,11 +563,12 @@ class PersonalAssistantApp(tk.Tk):
             style = "TabBarActive.TButton" if widget == current_widget else "TabBar.TButton"
             btn.configure(style=style)
 
-    def _scroll_active_tab_into_view(self) -> None:
+    def _scroll_active_tab_into_view(self, current_id: Optional[str] = None) -> None:
         if not hasattr(self, "tabs_canvas"):
             return
         try:
-            current_id = self.notebook.select()
+            if current_id is None:
+                current_id = self.notebook.select()
             current_widget = self.nametowidget(current_id) if current_id else None
         except tk.TclError:
             current_widget = None
@@ -543,18 +687,36 @@ class PersonalAssistantApp(tk.Tk):
         self._sync_tab_buttons(desired_tabs)
 
     def _check_for_updates_async(self) -> None:
-        if not updater.should_check_for_updates():
-            return
-        thread = threading.Thread(target=self._check_for_updates_worker, daemon=True)
-        thread.start()
+        if not updater.should_check_for_updates():
+            return
+        # Answer from the last check straight away and refresh in the background;
+        # the worker only prompts again if it finds a different release.
+        cached = updater.load_cached_update(__version__)
+        threading.Thread(
+            target=self._check_for_updates_worker,
+            args=(cached.version if cached else None,),
+            name="PA-update-check",
+            daemon=True,
+        ).start()
+        if cached is not None:
+            self._prompt_update(cached)
 
-    def _check_for_updates_worker(self) -> None:
-        info = updater.check_for_update(__version__)
-        if info is None:
+    def _check_for_updates_worker(self, cached_version: Optional[str] = None) -> None:
+        # Nothing joins this thread, so failures have to be logged here.
+        try:
+            info = updater.check_for_update(__version__)
+        except Exception as exc:
+            updater.log_update_error("Background update check failed", exc)
+            return
+        if info is None or info.version == cached_version:
             return
-        self.after(0, lambda: self._prompt_update(info))
+        self._post_to_ui(self._prompt_update, info)
 
     def _prompt_update(self, info: "updater.AvailableUpdate") -> None:
+        # The cached prompt may still be open, or an install already running,
+        # when the background check posts its own answer.
+        if self._update_prompt_open or self._update_install_started:
+            return
         summary_lines = [f"A new version ({info.version}) is available."]
         notes = (info.notes or "").strip()
         if notes:
@@ -564,28 +726,33 @@ class PersonalAssistantApp(tk.Tk):
             summary_lines.append(preview)
         summary_lines.append("")
         summary_lines.append("Install now? The app will download the update, close, and you'll reopen it manually once finished.")
-        if not messagebox.askyesno("Update Available", "\n".join(summary_lines), parent=self):
+        self._update_prompt_open = True
+        try:
+            accepted = messagebox.askyesno("Update Available", "\n".join(summary_lines), parent=self)
+        finally:
+            self._update_prompt_open = False
+        if not accepted:
             return
         self._begin_update_install(info)
 
     def _begin_update_install(self, info: "updater.AvailableUpdate") -> None:
+        self._update_install_started = True
         progress_window = UpdateProgressWindow(self, info, self.theme)
 
         def worker() -> None:
             try:
                 updater.prepare_and_schedule_restart(info, progress_window.report_progress)
             except updater.UpdateError as exc:
-                self.after(
-                    0,
-                    lambda: (
-                        progress_window.close(),
-                        messagebox.showerror("Update Failed", str(exc), parent=self),
-                    ),
-                )
+                self._post_to_ui(self._report_update_failure, progress_window, str(exc))
                 return
-            self.after(0, lambda: progress_window.mark_complete(self._restart_for_update))
+            self._post_to_ui(progress_window.mark_complete, self._restart_for_update)
+
+        threading.Thread(target=worker, name="PA-update-install", daemon=True).start()
 
-        threading.Thread(target=worker, daemon=True).start()
+    def _report_update_failure(self, progress_window: "UpdateProgressWindow", message: str) -> None:
+        self._update_install_started = False
+        progress_window.close()
+        messagebox.showerror("Update Failed", message, parent=self)
 
     def _restart_for_update(self) -> None:
         messagebox.showinfo(
@@ -596,20 +763,16 @@ class PersonalAssistantApp(tk.Tk):
         self.after(100, self.on_close)
 
     def _ensure_icon_file(self) -> Optional[Path]:
+        if self._icon_path is not None and self._icon_path.exists():
+            return self._icon_path
         icon_path = self.data_root / "personal_assistant.ico"
         if icon_path.exists():
             return icon_path
-        candidates: List[Path] = []
-        if hasattr(sys, "_MEIPASS"):
-            candidates.append(Path(sys._MEIPASS) / "personal_assistant.ico")
-        executable_dir = Path(sys.executable).resolve().parent
-        candidates.append(executable_dir / "personal_assistant.ico")
-        candidates.append(self.project_root / "assets" / "personal_assistant.ico")
-        for candidate in candidates:
+        for candidate in _icon_candidates():
             if candidate.exists():
                 try:
                     icon_path.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(candidate, icon_path)
+                    _fast_copy2(candidate, icon_path)
                     return icon_path
                 except Exception:
                     continue
@@ -624,43 +787,102 @@ class PersonalAssistantApp(tk.Tk):
                 pass
 
     def _should_manage_shortcut(self) -> bool:
-        return sys.platform.startswith("win") and bool(getattr(sys, "frozen", False))
+        return _manages_shortcuts()
 
-    def _ensure_shortcuts(self) -> None:
-        if not self._should_manage_shortcut():
-            self.settings_tab.update_shortcut_state("desktop", False)
-            self.settings_tab.update_shortcut_state("start_menu", False)
-            return
-        icon = self._icon_path or self._ensure_icon_file()
-        if icon is not None and icon.exists():
-            self._icon_path = icon
+    def _post_init_sequence(self) -> None:
+        self._position_settings_button()
+        self.notification_manager.start()
+        self._ensure_shortcuts()
+        self._check_for_updates_async()
+
+    def _post_to_ui(self, callback: Callable[..., None], *args: object) -> None:
+        """Schedule ``callback`` on the Tk thread from a background worker."""
+        try:
+            self.after(0, callback, *args)
+        except (RuntimeError, tk.TclError):
+            # The window was closed while the worker was running.
+            pass
+
+    def _ensure_shortcuts(self) -> None:
+        if not self._should_manage_shortcut():
+            self.settings_tab.update_shortcut_state("desktop", False)
+            self.settings_tab.update_shortcut_state("start_menu", False)
+            return
+        if self._icon_path is None:
+            self._icon_path = self._ensure_icon_file()
             self._apply_window_icon()
-        target = Path(sys.executable).resolve()
-        desktop_exists = desktop_shortcut_exists()
-        start_exists = start_menu_shortcut_exists()
-        if self.settings.desktop_shortcut and not desktop_exists:
-            if self._create_shortcut("desktop", target):
-                desktop_exists = True
-        elif not self.settings.desktop_shortcut and desktop_exists:
-            if self._remove_shortcut("desktop"):
-                desktop_exists = False
-        if self.settings.start_menu_shortcut and not start_exists:
-            if self._create_shortcut("start_menu", target):
-                start_exists = True
-        elif not self.settings.start_menu_shortcut and start_exists:
-            if self._remove_shortcut("start_menu"):
-                start_exists = False
-        self.settings.desktop_shortcut = desktop_exists
-        self.settings.start_menu_shortcut = start_exists
-        self.settings_tab.update_shortcut_state("desktop", desktop_exists)
-        self.settings_tab.update_shortcut_state("start_menu", start_exists)
-        save_settings(self.settings_path, self.settings)
+        wanted = {
+            "desktop": self.settings.desktop_shortcut,
+            "start_menu": self.settings.start_menu_shortcut,
+        }
+        self._executor.submit(
+            self._sync_shortcuts_worker,
+            _target_executable(),
+            self._icon_path,
+            wanted,
+            dict(self._shortcut_generation),
+        )
+
+    def _sync_shortcuts_worker(
+        self,
+        target: Path,
+        icon: Optional[Path],
+        wanted: dict[str, bool],
+        generations: dict[str, int],
+    ) -> None:
+        # Filesystem/COM work only; the outcome is applied on the Tk thread.
+        states: dict[str, bool] = {}
+        errors: list[tuple[str, str, str]] = []
+        with _com_apartment():
+            for kind, enabled in wanted.items():
+                label = "Desktop Shortcut" if kind == "desktop" else "Start Menu Shortcut"
+                exists = desktop_shortcut_exists() if kind == "desktop" else start_menu_shortcut_exists()
+                if enabled and not exists:
+                    if icon is None or not icon.exists():
+                        errors.append((kind, label, "Unable to locate the application icon for the shortcut."))
+                    else:
+                        if kind == "desktop":
+                            exists = create_desktop_shortcut(target, icon)
+                        else:
+                            exists = create_start_menu_shortcut(target, icon)
+                        if not exists:
+                            errors.append((kind, label, f"Unable to create the {label.lower()}."))
+                elif not enabled and exists:
+                    removed = remove_desktop_shortcut() if kind == "desktop" else remove_start_menu_shortcut()
+                    exists = not removed
+                states[kind] = exists
+        self._post_to_ui(self._apply_shortcut_sync, states, errors, generations)
+
+    def _apply_shortcut_sync(
+        self,
+        states: dict[str, bool],
+        errors: list[tuple[str, str, str]],
+        generations: dict[str, int],
+    ) -> None:
+        # Kinds the user toggled while the worker ran keep their newer state.
+        current = {
+            kind: state for kind, state in states.items()
+            if self._shortcut_generation[kind] == generations[kind]
+        }
+        if not current:
+            return
+        self._shortcut_state.update(current)
+        if "desktop" in current:
+            self.settings.desktop_shortcut = current["desktop"]
+        if "start_menu" in current:
+            self.settings.start_menu_shortcut = current["start_menu"]
+        for kind, exists in current.items():
+            self.settings_tab.update_shortcut_state(kind, exists)
+        self._mark_settings_dirty()
+        for kind, label, message in errors:
+            if kind in current:
+                messagebox.showerror(label, message, parent=self)
 
     def _create_shortcut(self, kind: str, target: Path) -> bool:
-        icon = self._icon_path or self._ensure_icon_file()
-        if icon is not None and icon.exists():
-            self._icon_path = icon
+        if self._icon_path is None:
+            self._icon_path = self._ensure_icon_file()
             self._apply_window_icon()
+        icon = self._icon_path
         label = "Desktop Shortcut" if kind == "desktop" else "Start Menu Shortcut"
         if icon is None or not icon.exists():
             messagebox.showerror(
@@ -673,14 +895,27 @@ class PersonalAssistantApp(tk.Tk):
             success = create_desktop_shortcut(target, icon)
         else:
             success = create_start_menu_shortcut(target, icon)
-        if not success:
+        if success:
+            self._shortcut_state[kind] = True
+        else:
             messagebox.showerror(label, f"Unable to create the {label.lower()}.", parent=self)
         return success
 
     def _remove_shortcut(self, kind: str) -> bool:
         if kind == "desktop":
-            return remove_desktop_shortcut()
-        return remove_start_menu_shortcut()
+            success = remove_desktop_shortcut()
+        else:
+            success = remove_start_menu_shortcut()
+        if success:
+            self._shortcut_state[kind] = False
+        return success
+
+    def _shortcut_exists(self, kind: str) -> bool:
+        cached = self._shortcut_state.get(kind)
+        if cached is None:
+            cached = desktop_shortcut_exists() if kind == "desktop" else start_menu_shortcut_exists()
+            self._shortcut_state[kind] = cached
+        return cached
 
     def _handle_setting_toggle(self, kind: str, enabled: bool) -> None:
         if kind == "daily_notifications":
@@ -691,7 +926,7 @@ class PersonalAssistantApp(tk.Tk):
                 end_time = self._coerce_time_to_dt(self.settings.daily_update_end, "17:00")
                 self.notification_manager.configure_daily_log_hours(start_time, end_time)
             self.settings_tab.update_daily_notification_state(bool(enabled))
-            save_settings(self.settings_path, self.settings)
+            self._mark_settings_dirty()
             return
 
         label = "Desktop" if kind == "desktop" else "Start Menu"
@@ -703,7 +938,8 @@ class PersonalAssistantApp(tk.Tk):
             )
             self.settings_tab.update_shortcut_state(kind, False)
             return
-        target = Path(sys.executable).resolve()
+        self._shortcut_generation[kind] += 1
+        target = _target_executable()
         if enabled:
             success = self._create_shortcut(kind, target)
             if success:
@@ -728,9 +964,9 @@ class PersonalAssistantApp(tk.Tk):
                     self.settings.desktop_shortcut = False
                 else:
                     self.settings.start_menu_shortcut = False
-        self.settings_tab.update_shortcut_state("desktop", desktop_shortcut_exists())
-        self.settings_tab.update_shortcut_state("start_menu", start_menu_shortcut_exists())
-        save_settings(self.settings_path, self.settings)
+        self.settings_tab.update_shortcut_state("desktop", self._shortcut_exists("desktop"))
+        self.settings_tab.update_shortcut_state("start_menu", self._shortcut_exists("start_menu"))
+        self._mark_settings_dirty()
 
     def _handle_daily_hours_change(self, start_text: str, end_text: str) -> None:
         try:
@@ -745,7 +981,7 @@ class PersonalAssistantApp(tk.Tk):
             return
         self.settings.daily_update_start = self._format_time_storage(start_time)
         self.settings.daily_update_end = self._format_time_storage(end_time)
-        save_settings(self.settings_path, self.settings)
+        self._mark_settings_dirty()
         self.notification_manager.configure_daily_log_hours(start_time, end_time)
         self.settings_tab.update_daily_hours(
             self.settings.daily_update_start,
@@ -763,12 +999,12 @@ class PersonalAssistantApp(tk.Tk):
         self.settings.theme = normalized
         self._configure_styles(self.theme)
         self._apply_theme_to_children()
-        save_settings(self.settings_path, self.settings)
+        self._mark_settings_dirty()
 
     def _handle_time_format_change(self, use_24_hour: bool) -> None:
         self.settings.use_24_hour_time = bool(use_24_hour)
         utils.set_use_24_hour_time(self.settings.use_24_hour_time)
-        save_settings(self.settings_path, self.settings)
+        self._mark_settings_dirty()
         self.settings_tab.update_time_format(self.settings.use_24_hour_time)
         self._apply_time_format_to_children()
 
@@ -777,7 +1013,7 @@ class PersonalAssistantApp(tk.Tk):
         if cleaned != self._special_feature_keys:
             self._special_feature_keys = cleaned
             self.settings.special_features = cleaned
-            save_settings(self.settings_path, self.settings)
+            self._mark_settings_dirty()
         self._sync_notebook_tabs()
         self.settings_tab.update_special_features(describe_special_features(self._special_feature_keys))
         self.settings_tab.update_jira_section_visibility("jira" in self._special_feature_keys)
@@ -812,7 +1048,7 @@ class PersonalAssistantApp(tk.Tk):
 
     def _handle_jira_settings_update(self, jira_settings: JiraSettings) -> None:
         self.settings.jira = jira_settings
-        save_settings(self.settings_path, self.settings)
+        self._mark_settings_dirty()
         jira_tab = self._special_tab_cache.get("jira")
         if jira_tab is not None and hasattr(jira_tab, "on_settings_updated"):
             jira_tab.on_settings_updated()
@@ -836,20 +1072,20 @@ class PersonalAssistantApp(tk.Tk):
         self.settings_tab.update_theme_selection(self.theme_name)
         if hasattr(self, "tabs_canvas"):
             self.tabs_canvas.configure(bg=self.theme.surface_bg)
-        for tab, _label in self._core_tabs.values():
+        for tab in self._realized_tabs.values():
             if hasattr(tab, "apply_theme"):
                 tab.apply_theme(self.theme)
         for tab in self._special_tab_cache.values():
             if hasattr(tab, "apply_theme"):
                 tab.apply_theme(self.theme)
-        for window in list(self.notifications):
-            if hasattr(window, "apply_theme"):
+        for window in self.notifications:
+            if window.winfo_exists():
                 window.apply_theme(self.theme)
         self._sync_settings_button_state()
         self._update_tab_button_styles()
 
     def _apply_time_format_to_children(self) -> None:
-        for tab, _label in self._core_tabs.values():
+        for tab in self._realized_tabs.values():
             if hasattr(tab, "apply_time_format"):
                 tab.apply_time_format(self.settings.use_24_hour_time)
             elif hasattr(tab, "refresh"):
@@ -871,45 +1107,122 @@ class PersonalAssistantApp(tk.Tk):
     def _format_time_storage(value: dt_time) -> str:
         return f"{value.hour:02d}:{value.minute:02d}"
 
-    def _handle_notification(self, payload: NotificationPayload) -> None:
-        self.after(0, lambda: self.show_notification(payload))
+    def _handle_notification(self, payload: NotificationPayload) -> None:
+        # Runs on the NotificationManager thread. Bursts (e.g. after resume from
+        # sleep) are queued and drained together on a single Tk tick.
+        self._notif_queue.append(payload)
+        if self._notif_drain_scheduled:
+            return
+        self._notif_drain_scheduled = True
+        self._post_to_ui(self._drain_notifications)
+
+    def _drain_notifications(self) -> None:
+        self._notif_drain_scheduled = False
+        if self._notif_queue:
+            self._refresh_screen_metrics()
+        self._prune_dead_notifications()
+        opened = 0
+        while self._notif_queue and opened < _NOTIFICATION_DRAIN_BATCH:
+            self._open_notification(self._notif_queue.popleft())
+            opened += 1
+        if self._notif_queue and not self._notif_drain_scheduled:
+            self._notif_drain_scheduled = True
+            self.after(16, self._drain_notifications)
 
     # ---------------------------------------------------------------- Events
-    def show_notification(self, payload: NotificationPayload) -> None:
-        body_text = payload.body.strip() if payload.body else ""
-        fallback = utils.format_time(payload.occurs_at)
-        self.system_notifier.notify(payload.title, body_text or fallback)
-        window = NotificationWindow(self, payload, self.theme)
+    def _open_notification(self, payload: NotificationPayload) -> None:
+        body_text = payload.body.strip() if payload.body else ""
+        time_text = _format_notification_time(payload.occurs_at, utils.use_24_hour_time())
+        self.system_notifier.notify(payload.title, body_text or time_text)
+        window = NotificationWindow(self, payload, self.theme, time_text=time_text)
+        # Once the stack reaches the top of the screen the oldest toast makes
+        # room; every slot above it shifts down by one.
+        if len(self.notifications) >= self._max_notification_slots():
+            self.notifications[0].dismiss()
+        window._slot = len(self.notifications)
         self.notifications.append(window)
-        self._rearrange_notifications()
-
-    def _rearrange_notifications(self) -> None:
-        screen_width = self.winfo_screenwidth()
-        screen_height = self.winfo_screenheight()
-        padding = 20
-        window_width = 320
-        window_height = 140
-
-        for index, window in enumerate(list(self.notifications)):
-            if not window.winfo_exists():
-                self.notifications.remove(window)
+        self._rearrange_notifications(window._slot)
+
+    def _prune_dead_notifications(self) -> None:
+        # Toasts destroyed outside dismiss() (window manager, shutdown) never
+        # released their slot; drop them before stacking new ones.
+        alive: list[NotificationWindow] = []
+        first_dead: Optional[int] = None
+        for index, window in enumerate(self.notifications):
+            if window.winfo_exists():
+                alive.append(window)
                 continue
-            x = screen_width - window_width - padding
-            y = screen_height - (index + 1) * (window_height + 10) - padding
-            window.geometry(f"{window_width}x{window_height}+{x}+{y}")
+            window._slot = None
+            if first_dead is None:
+                first_dead = index
+        if first_dead is None:
+            return
+        self.notifications = alive
+        self._rearrange_notifications(first_dead)
+
+    def _max_notification_slots(self) -> int:
+        usable = self._screen_h - 2 * _NOTIFICATION_PADDING
+        return max(1, usable // (_NOTIFICATION_HEIGHT + _NOTIFICATION_GAP))
 
+    def _rearrange_notifications(self, start: int = 0) -> None:
+        """Position the notification stack from slot ``start`` upwards.
+
+        Slots below ``start`` are untouched, so appending a toast or dismissing
+        the newest one costs a single geometry call.
+        """
+        window_width = _NOTIFICATION_WIDTH
+        window_height = _NOTIFICATION_HEIGHT
+        x = self._screen_w - window_width - _NOTIFICATION_PADDING
+        index = start
+        while index < len(self.notifications):
+            window = self.notifications[index]
+            window._slot = index
+            y = self._screen_h - (index + 1) * (window_height + _NOTIFICATION_GAP) - _NOTIFICATION_PADDING
+            geom = (window_width, window_height, x, y)
+            if window._last_geom != geom:
+                try:
+                    window.geometry(f"{window_width}x{window_height}+{x}+{y}")
+                except tk.TclError:
+                    # Destroyed outside dismiss() (window manager, shutdown):
+                    # drop the dead slot and let the next toast take it.
+                    window._slot = None
+                    del self.notifications[index]
+                    continue
+                window._last_geom = geom
+            index += 1
+
+    def _refresh_screen_metrics(self) -> None:
+        # Read once per notification burst rather than on every window event.
+        self._screen_w = self.winfo_screenwidth()
+        self._screen_h = self.winfo_screenheight()
+
     def _position_settings_button(self, event: Optional[tk.Event] = None) -> None:
         self._place_settings_overlay()
         self._update_tab_scroll_controls()
 
+    def _schedule_settings_reposition(self, event: Optional[tk.Event] = None) -> None:
+        # A resize drag emits a <Configure> storm; only act on the last one per frame.
+        if self._reposition_after_id is not None:
+            try:
+                self.after_cancel(self._reposition_after_id)
+            except tk.TclError:
+                pass
+        self._reposition_after_id = self.after(16, self._reposition_for_resize)
+
+    def _reposition_for_resize(self) -> None:
+        self._reposition_after_id = None
+        try:
+            geom = (self.notebook.winfo_width(), self.notebook.winfo_height())
+        except tk.TclError:
+            return
+        if geom == self._notebook_geom:
+            return
+        self._notebook_geom = geom
+        self._position_settings_button()
+
     def _place_settings_overlay(self) -> None:
         if not self._settings_visible:
             return
-        try:
-            self.notebook.update_idletasks()
-            self.settings_tab_frame.update_idletasks()
-        except tk.TclError:
-            pass
         offset = self._compute_notebook_content_offset()
         height = max(0, self.notebook.winfo_height() - offset)
         params = {
@@ -932,8 +1245,40 @@ class PersonalAssistantApp(tk.Tk):
     def _compute_notebook_content_offset(self) -> int:
         return 0
 
+    def _build_log_tab(self, parent: tk.Misc) -> tk.Misc:
+        from .log_tab import LogTab
+
+        return LogTab(parent, self.db)
+
+    def _build_scrum_tab(self, parent: tk.Misc) -> tk.Misc:
+        from .scrum_tab import ScrumTab
+
+        return ScrumTab(parent, self.db, self.theme)
+
+    def _build_contact_tab(self, parent: tk.Misc) -> tk.Misc:
+        from .contact_tab import ContactTab
+
+        return ContactTab(parent, self.data_root, app_version=__version__)
+
+    def _realize_selected_tab(self, current: Optional[str] = None) -> None:
+        if current is None:
+            try:
+                current = self.notebook.select()
+            except tk.TclError:
+                return
+        key = self._lazy_tab_keys.get(current)
+        if key is None or key in self._realized_tabs:
+            return
+        page = self._core_tabs[key][0]
+        widget = self._core_tab_factories[key](page)
+        widget.pack(fill=tk.BOTH, expand=True)
+        self._realized_tabs[key] = widget
+        setattr(self, f"{key}_tab", widget)
+
     def _record_last_notebook_tab(self, event: Optional[tk.Event] = None) -> None:
+        # Query the selection once and hand the path to every helper below.
         current = self.notebook.select()
+        self._realize_selected_tab(current)
         if self._settings_visible:
             self.settings_tab_frame.place_forget()
             self._settings_visible = False
@@ -944,13 +1289,13 @@ class PersonalAssistantApp(tk.Tk):
                 self.settings_button.state(["!pressed"])
             except tk.TclError:
                 pass
-            self._update_tab_button_styles()
-            self._scroll_active_tab_into_view()
+            self._update_tab_button_styles(current)
+            self._scroll_active_tab_into_view(current)
             return
         self._last_notebook_tab = current
         self._sync_settings_button_state()
-        self._update_tab_button_styles()
-        self._scroll_active_tab_into_view()
+        self._update_tab_button_styles(current)
+        self._scroll_active_tab_into_view(current)
 
     def _toggle_settings_view(self) -> None:
         if self._settings_visible:
@@ -961,9 +1306,11 @@ class PersonalAssistantApp(tk.Tk):
     def _show_settings_view(self) -> None:
         self._last_notebook_tab = self.notebook.select()
         self._settings_visible = True
-        self._place_settings_overlay()
         self._sync_settings_button_state()
         self._position_settings_button()
+        if self._notebook_geom is None:
+            # The notebook has not reported a size yet; place again once it has.
+            self.after_idle(self._place_settings_overlay)
         try:
             self.settings_button.state(["pressed"])
         except tk.TclError:
@@ -995,17 +1342,39 @@ class PersonalAssistantApp(tk.Tk):
         self.settings_button.configure(style=style_name)
 
     def remove_notification(self, window: "NotificationWindow") -> None:
-        if window in self.notifications:
-            self.notifications.remove(window)
-        self._rearrange_notifications()
+        slot = window._slot
+        if slot is None:
+            return
+        window._slot = None
+        del self.notifications[slot]
+        self._rearrange_notifications(slot)
+
+    def _mark_settings_dirty(self) -> None:
+        """Schedule a settings write, coalescing bursts of changes into one."""
+        self._settings_dirty = True
+        if self._settings_flush_pending:
+            return
+        self._settings_flush_pending = True
+        self.after(_SETTINGS_FLUSH_DELAY_MS, self._flush_settings)
+
+    def _flush_settings(self, force: bool = False) -> None:
+        self._settings_flush_pending = False
+        if not (self._settings_dirty or force):
+            return
+        self._settings_dirty = False
+        save_settings(self.settings_path, self.settings)
 
     def on_close(self) -> None:
         self.notification_manager.stop()
+        self._executor.shutdown(wait=False, cancel_futures=True)
         self.db.close()
-        save_settings(self.settings_path, self.settings)
+        self._flush_settings(force=True)
         self.destroy()
 
 class UpdateProgressWindow(tk.Toplevel):
+    # Minimum delay between progress redraws while downloading (~20 Hz).
+    PROGRESS_INTERVAL_MS = 50
+
     def __init__(self, master: PersonalAssistantApp, update_info: "updater.AvailableUpdate", theme: ThemePalette) -> None:
         super().__init__(master)
         self.master = master
@@ -1015,6 +1384,12 @@ class UpdateProgressWindow(tk.Toplevel):
         self.transient(master)
         self.title("Installing Update")
         self.progress_mode = "indeterminate"
+        self._pending_progress: tuple[int, int] | None = None
+        self._progress_scheduled = False
+        # Last values written to the widgets, so steady-state chunks skip no-op Tcl writes.
+        self._progress_maximum: int | None = None
+        self._status_text = "Preparing download..."
+        self._percent_text = ""
 
         container = ttk.Frame(self, padding=20)
         container.pack(fill=tk.BOTH, expand=True)
@@ -1022,13 +1397,13 @@ class UpdateProgressWindow(tk.Toplevel):
         title = update_info.release_name or f"Version {update_info.version}"
         ttk.Label(container, text=f"Updating to {title}", style="SidebarHeading.TLabel").pack(anchor="w")
 
-        self.status_var = tk.StringVar(value="Preparing download...")
-        ttk.Label(container, textvariable=self.status_var, wraplength=320).pack(anchor="w", pady=(10, 6))
+        self.status_var = tk.StringVar(value=self._status_text)
+        ttk.Label(container, textvariable=self.status_var, wraplength=_PROGRESS_WRAP).pack(anchor="w", pady=(10, 6))
 
         self.instructions_var = tk.StringVar(
             value="Once the download finishes, Personal Assistant will close so the update can be installed. Reopen it from your shortcut afterwards."
         )
-        ttk.Label(container, textvariable=self.instructions_var, wraplength=320, foreground=self.theme.text_secondary).pack(anchor="w", pady=(0, 12))
+        ttk.Label(container, textvariable=self.instructions_var, wraplength=_PROGRESS_WRAP, foreground=self.theme.text_secondary).pack(anchor="w", pady=(0, 12))
 
         self.progress = ttk.Progressbar(container, mode="indeterminate", length=320)
         self.progress.pack(fill=tk.X)
@@ -1053,42 +1428,73 @@ class UpdateProgressWindow(tk.Toplevel):
         self.geometry(f"{width}x{height}+{x}+{y}")
 
     def report_progress(self, downloaded: int, total: int) -> None:
-        def _apply() -> None:
-            if total <= 0:
-                if self.progress_mode != "indeterminate":
-                    self.progress_mode = "indeterminate"
-                    self.progress.configure(mode="indeterminate")
-                    self.progress.start(10)
-                    self.percent_var.set("")
-                self.status_var.set("Downloading update...")
-                return
-            if self.progress_mode != "determinate":
-                self.progress_mode = "determinate"
-                self.progress.stop()
-                self.progress.configure(mode="determinate", maximum=max(total, 1))
-            clamped = max(0, min(downloaded, total))
-            self.progress["value"] = clamped
-            percent = (clamped / total) * 100 if total else 0
-            self.percent_var.set(f"{percent:.0f}%")
-            self.status_var.set("Downloading update...")
+        # Called from the download thread for every chunk; keep only the latest
+        # values and let a single pending Tk callback apply them.
+        self._pending_progress = (downloaded, total)
+        if self._progress_scheduled:
+            return
+        self._progress_scheduled = True
+        self.after(self.PROGRESS_INTERVAL_MS, self._flush_progress)
 
-        self.after(0, _apply)
+    def _flush_progress(self) -> None:
+        self._progress_scheduled = False
+        pending = self._pending_progress
+        self._pending_progress = None
+        if pending is None:
+            return
+        downloaded, total = pending
+        if total <= 0:
+            if self.progress_mode != "indeterminate":
+                self.progress_mode = "indeterminate"
+                self.progress.configure(mode="indeterminate")
+                self.progress.start(10)
+                self._progress_maximum = None
+                self._set_percent("")
+            self._set_status("Downloading update...")
+            return
+        if self.progress_mode != "determinate":
+            self.progress_mode = "determinate"
+            self.progress.stop()
+            self.progress.configure(mode="determinate")
+        if self._progress_maximum != total:
+            self._progress_maximum = total
+            self.progress.configure(maximum=max(total, 1))
+        clamped = max(0, min(downloaded, total))
+        self.progress["value"] = clamped
+        percent = (clamped / total) * 100 if total else 0
+        self._set_percent(f"{percent:.0f}%")
+        self._set_status("Downloading update...")
+
+    def _set_status(self, text: str) -> None:
+        if text != self._status_text:
+            self._status_text = text
+            self.status_var.set(text)
+
+    def _set_percent(self, text: str) -> None:
+        if text != self._percent_text:
+            self._percent_text = text
+            self.percent_var.set(text)
 
     def mark_complete(self, callback: Callable[[], None]) -> None:
         def _apply() -> None:
+            self._pending_progress = None
             if self.progress_mode == "indeterminate":
                 self.progress.stop()
                 self.progress.configure(mode="determinate", maximum=1, value=1)
             else:
                 self.progress["value"] = self.progress["maximum"]
             self.progress_mode = "determinate"
-            self.percent_var.set("100%")
-            self.status_var.set("Download complete. Closing to install update...")
+            self._set_percent("100%")
+            self._set_status("Download complete. Closing to install update...")
             self.instructions_var.set("Personal Assistant will close now and finish installing the update. Reopen it from your shortcut once the window disappears.")
-            self.after(800, lambda: (self.close(), callback()))
+            self.after(800, self._close_and_continue, callback)
 
         self.after(0, _apply)
 
+    def _close_and_continue(self, callback: Callable[[], None]) -> None:
+        self.close()
+        callback()
+
     def close(self) -> None:
         try:
             self.progress.stop()
@@ -1098,17 +1504,44 @@ class UpdateProgressWindow(tk.Toplevel):
             self.destroy()
 
 
+@lru_cache(maxsize=512)
+def _format_notification_time(occurs_at: datetime, use_24_hour: bool) -> str:
+    return utils.format_time(occurs_at, use_24_hour)
+
+
+@lru_cache(maxsize=512)
+def _notification_body_text(kind: str, body: str) -> str:
+    if kind == "event":
+        if body.startswith("All day"):
+            parts = body.split(" - ", 1)
+            return parts[1] if len(parts) > 1 else ""
+        parts = body.split(" - ", 1)
+        if len(parts) > 1:
+            return parts[1]
+        return parts[0]
+    return body
+
+
 class NotificationWindow(tk.Toplevel):
-    def __init__(self, master: PersonalAssistantApp, payload: NotificationPayload, theme: ThemePalette) -> None:
+    def __init__(
+        self,
+        master: PersonalAssistantApp,
+        payload: NotificationPayload,
+        theme: ThemePalette,
+        time_text: Optional[str] = None,
+    ) -> None:
         super().__init__(master)
         self.master = master
         self.payload = payload
         self.theme = theme
+        self._time_text = time_text
         self.configure(bg=self.theme.notification_bg)
         self.overrideredirect(True)
         self.attributes("-topmost", True)
         self._body_label: ttk.Label | None = None
         self._time_label: ttk.Label | None = None
+        self._last_geom: tuple[int, int, int, int] | None = None
+        self._slot: int | None = None
 
         frame = ttk.Frame(self, padding=14)
         frame.pack(fill=tk.BOTH, expand=True)
@@ -1116,13 +1549,13 @@ class NotificationWindow(tk.Toplevel):
         header_text = "Reminder" if payload.kind == "event" else payload.title
         ttk.Label(frame, text=header_text, style="SidebarHeading.TLabel").pack(anchor="w")
         if payload.kind == "event":
-            ttk.Label(frame, text=payload.title, font=("Segoe UI", 11, "bold"), wraplength=280).pack(anchor="w", pady=(4, 0))
+            ttk.Label(frame, text=payload.title, font=FONT_LARGE_BOLD, wraplength=_NOTIFICATION_WRAP).pack(anchor="w", pady=(4, 0))
 
         self._time_label = ttk.Label(frame, text=self._derive_time_text(payload), foreground=self.theme.text_secondary)
         self._time_label.pack(anchor="w", pady=(2, 6))
         body_text = self._derive_body_text(payload)
         if body_text:
-            self._body_label = ttk.Label(frame, text=body_text, wraplength=280, foreground=self.theme.notification_body)
+            self._body_label = ttk.Label(frame, text=body_text, wraplength=_NOTIFICATION_WRAP, foreground=self.theme.notification_body)
             self._body_label.pack(anchor="w")
 
         ttk.Button(frame, text="Dismiss", command=self.dismiss).pack(anchor="e", pady=(10, 0))
@@ -1131,24 +1564,18 @@ class NotificationWindow(tk.Toplevel):
     def _derive_time_text(self, payload: NotificationPayload) -> str:
         if payload.kind == "event" and (payload.body or "").startswith("All day"):
             return "All day"
-        return utils.format_time(payload.occurs_at)
+        if self._time_text is None:
+            self._time_text = _format_notification_time(payload.occurs_at, utils.use_24_hour_time())
+        return self._time_text
 
     def _derive_body_text(self, payload: NotificationPayload) -> str:
-        if payload.kind == "event":
-            body = payload.body or ""
-            if body.startswith("All day"):
-                parts = body.split(" - ", 1)
-                return parts[1] if len(parts) > 1 else ""
-            parts = body.split(" - ", 1)
-            if len(parts) > 1:
-                return parts[1]
-            return parts[0]
-        return payload.body or ""
+        return _notification_body_text(payload.kind, payload.body or "")
 
     def dismiss(self) -> None:
+        # Always release the stack slot, even if Tk already tore the window down.
+        self.master.remove_notification(self)
         if self.winfo_exists():
             self.destroy()
-            self.master.remove_notification(self)
 
     def apply_theme(self, theme: ThemePalette) -> None:
         self.theme = theme
@@ -1159,28 +1586,67 @@ class NotificationWindow(tk.Toplevel):
             self._body_label.configure(foreground=self.theme.notification_body)
 
 
+@contextmanager
+def _com_apartment() -> Iterator[None]:
+    """Initialise COM for the current worker thread when pywin32 is available."""
+    try:
+        import pythoncom  # type: ignore
+    except ImportError:
+        yield
+        return
+    pythoncom.CoInitialize()
+    try:
+        yield
+    finally:
+        pythoncom.CoUninitialize()
+
+
 def _ensure_installed_binary(data_root: Path) -> None:
     if not getattr(sys, "frozen", False):
         return
 
     expected_exe = data_root / "PersonalAssistant.exe"
-    current_exe = Path(sys.executable).resolve()
+    # The installed copy relaunching itself is the steady state; a lexical
+    # comparison settles that without the realpath walk behind resolve().
+    if _normalized_path(sys.executable) == _normalized_path(expected_exe):
+        current_exe = expected_exe
+    else:
+        current_exe = _target_executable()
     version_file = data_root / "app_version.txt"
 
     def _write_version_file() -> None:
+        payload = __version__.encode("utf-8")
+        try:
+            if version_file.read_bytes() == payload:
+                return
+        except OSError:
+            pass
         try:
-            version_file.write_text(__version__, encoding="utf-8")
+            tmp_path = version_file.with_suffix(".tmp")
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, version_file)
         except Exception:
             pass
 
     def _copy_icon(source: Path) -> None:
         icon_source = source.with_name("personal_assistant.ico")
-        if not icon_source.exists():
-            return
         icon_target = data_root / "personal_assistant.ico"
+        source_stat = _stat_or_none(icon_source)
+        if source_stat is None:
+            return
+        # copy2 preserves mtime, so an earlier copy of this icon matches on size and mtime.
+        target_stat = _stat_or_none(icon_target)
+        if (
+            target_stat is not None
+            and target_stat.st_size == source_stat.st_size
+            and source_stat.st_mtime <= target_stat.st_mtime
+        ):
+            return
         try:
             icon_target.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(icon_source, icon_target)
+            tmp_path = icon_target.with_suffix(".ico.tmp")
+            _fast_copy2(icon_source, tmp_path)
+            os.replace(tmp_path, icon_target)
         except Exception:
             pass
 
@@ -1193,36 +1659,65 @@ def _ensure_installed_binary(data_root: Path) -> None:
 
     expected_exe.parent.mkdir(parents=True, exist_ok=True)
 
+    try:
+        installed_raw: Optional[bytes] = version_file.read_bytes()
+    except OSError:
+        installed_raw = None
+    # The steady state is an identical version string; only parse on a mismatch.
+    installed_is_current = installed_raw == __version__.encode("utf-8")
     installed_version_key: Optional[tuple[int, ...]] = None
-    if version_file.exists():
+    if installed_raw is not None and not installed_is_current:
         try:
-            installed_version_key = _parse_version(version_file.read_text(encoding="utf-8"))
+            installed_version_key = _parse_version(installed_raw.decode("utf-8"))
         except Exception:
             installed_version_key = None
 
-    current_version_key = _parse_version(__version__)
-
     def _launch_installed() -> None:
-        args = sys.argv[1:]
-        subprocess.Popen([str(expected_exe), *args])
+        exe = str(expected_exe)
+        argv = [exe, *sys.argv[1:]]
+        if hasattr(os, "posix_spawn"):
+            # No pipes to set up, so skip the Popen machinery entirely.
+            os.posix_spawn(exe, argv, os.environ)
+            sys.exit(0)
+
+        import subprocess
+
+        # An explicit executable skips CreateProcess's search of the command line.
+        subprocess.Popen(
+            argv,
+            executable=exe,
+            close_fds=False,
+            creationflags=getattr(subprocess, "DETACHED_PROCESS", 0) | getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0),
+        )
         sys.exit(0)
 
-    if expected_exe.exists():
-        if installed_version_key and installed_version_key >= current_version_key:
+    # One stat per executable, reused for both the existence and mtime checks.
+    expected_stat = _stat_or_none(expected_exe)
+    if expected_stat is not None:
+        if installed_is_current or (
+            installed_version_key and installed_version_key >= _parse_version(__version__)
+        ):
             _launch_installed()
             return
         if not installed_version_key:
-            try:
-                if expected_exe.stat().st_mtime >= current_exe.stat().st_mtime:
-                    _launch_installed()
-                    return
-            except OSError:
+            current_stat = _stat_or_none(current_exe)
+            if current_stat is None or expected_stat.st_mtime >= current_stat.st_mtime:
                 _launch_installed()
                 return
 
+    # Stage the executable beside its destination and swap it in atomically, so
+    # an interrupted copy leaves the previous install intact. The icon and
+    # version file already replace themselves the same way; the version file
+    # goes last so a partial install is retried on the next launch.
+    staged_exe = expected_exe.with_suffix(".exe.tmp")
     try:
-        shutil.copy2(current_exe, expected_exe)
+        _fast_copy2(current_exe, staged_exe)
+        os.replace(staged_exe, expected_exe)
     except Exception:
+        try:
+            staged_exe.unlink()
+        except OSError:
+            pass
         if expected_exe.exists():
             _launch_installed()
         return
@@ -1232,74 +1727,382 @@ def _ensure_installed_binary(data_root: Path) -> None:
     _launch_installed()
 
 
+def _normalized_path(path: Path | str) -> str:
+    return os.path.normcase(os.path.normpath(path))
+
+
+def _stat_or_none(path: Path) -> Optional[os.stat_result]:
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+_COPY_BUFSIZE = 1024 * 1024
+
+
+def _fast_copy2(src: Path | str, dst: Path | str) -> str:
+    """Like shutil.copy2, but copies contents through the platform fast path when available.
+
+    Only the permission bits and timestamps are carried over (no xattrs or
+    file flags), which is all the installer and migration rely on.
+    """
+    source = Path(src)
+    target = Path(dst)
+    if target.is_dir():
+        target = target / source.name
+    source_stat = os.stat(source)
+    if not _native_copy(source, target, source_stat.st_mode):
+        os.utime(target, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+    return str(target)
+
+
+def _native_copy(source: Path, target: Path, mode: int) -> bool:
+    """Copy file contents via CopyFileExW on Windows or an in-kernel copy elsewhere.
+
+    Returns True when the OS copy also carried the metadata over (CopyFileExW
+    preserves attributes and timestamps), so the caller can skip it.
+    """
+    if sys.platform.startswith("win"):
+        try:
+            import ctypes
+
+            cancel = ctypes.c_bool(False)
+            if ctypes.windll.kernel32.CopyFileExW(str(source), str(target), None, None, ctypes.byref(cancel), 0):
+                return True
+        except Exception:
+            pass
+    with source.open("rb") as fsrc, target.open("wb") as fdst:
+        if hasattr(os, "fchmod"):
+            os.fchmod(fdst.fileno(), stat.S_IMODE(mode))
+        if _kernel_copy(fsrc.fileno(), fdst.fileno()):
+            return False
+        fsrc.seek(0)
+        fdst.seek(0)
+        fdst.truncate()
+        shutil.copyfileobj(fsrc, fdst, _COPY_BUFSIZE)
+    return False
+
+
+# ioctl request for a whole-file copy-on-write clone (FICLONE in linux/fs.h).
+_FICLONE = 0x40049409
+
+
+def _kernel_copy(in_fd: int, out_fd: int) -> bool:
+    if sys.platform.startswith("linux"):
+        # On btrfs/XFS/bcachefs this shares extents instead of copying any data.
+        try:
+            import fcntl
+
+            fcntl.ioctl(out_fd, _FICLONE, in_fd)
+            return True
+        except (ImportError, OSError):
+            pass
+    chunk = 1 << 30
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is not None:
+        try:
+            while copy_file_range(in_fd, out_fd, chunk):
+                pass
+            return True
+        except OSError:
+            pass
+    if sys.platform.startswith("linux"):
+        try:
+            os.lseek(in_fd, 0, os.SEEK_SET)
+            os.lseek(out_fd, 0, os.SEEK_SET)
+            os.ftruncate(out_fd, 0)
+            while os.sendfile(out_fd, in_fd, None, chunk):
+                pass
+            return True
+        except OSError:
+            pass
+    return False
+
+
+_NON_DIGITS_RE = re.compile(r"\D+")
+
+
+@lru_cache(maxsize=8)
 def _parse_version(value: str) -> tuple[int, ...]:
+    # Digits are collapsed per dot/dash segment, so "1.3rc2" compares as (1, 32).
     cleaned = (value or "").strip().lower()
     if cleaned.startswith("v"):
         cleaned = cleaned[1:]
-    tokens: list[int] = []
-    for part in cleaned.replace("-", ".").split("."):
-        part = part.strip()
-        if not part:
-            continue
-        digits = "".join(ch for ch in part if ch.isdigit())
-        if digits:
-            tokens.append(int(digits))
+    strip_non_digits = _NON_DIGITS_RE.sub
+    tokens = [
+        int(digits)
+        for digits in (strip_non_digits("", part) for part in cleaned.replace("-", ".").split("."))
+        if digits
+    ]
     return tuple(tokens) if tokens else (0,)
 
 
+_MIGRATION_SENTINEL = ".migration_done"
+_legacy_migration_thread: Optional[threading.Thread] = None
+
+
 def _migrate_legacy_data(data_root: Path) -> None:
+    global _legacy_migration_thread
+    # Legacy data is only looked for until one migration pass has completed;
+    # after that a single access() check is the whole cost of this function.
+    sentinel = data_root / _MIGRATION_SENTINEL
+    if os.access(sentinel, os.F_OK):
+        return
     legacy_root = legacy_project_root()
     legacy_db = legacy_root / "assistant_app" / "assistant.db"
     target_db = data_root / "assistant.db"
-    if legacy_db.exists() and not target_db.exists():
+    if not target_db.exists() and legacy_db.exists():
         target_db.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(legacy_db, target_db)
+        _fast_copy2(legacy_db, target_db)
 
     legacy_runs = legacy_root / "data" / "email_runs"
     target_runs = data_root / "email_runs"
     if legacy_runs.exists() and not target_runs.exists():
+        # The email_runs tree can be large, so copy it off the UI startup path.
+        # The email ingest tab polls legacy_migration_ready() before touching it.
+        mark_legacy_migration_pending()
+        _legacy_migration_thread = threading.Thread(
+            target=_migrate_legacy_email_runs,
+            args=(legacy_runs, target_runs, sentinel),
+            name="LegacyMigration",
+        )
+        _legacy_migration_thread.start()
+        return
+    _mark_migration_done(sentinel)
+
+
+def _migrate_legacy_email_runs(legacy_runs: Path, target_runs: Path, sentinel: Path) -> None:
+    try:
         try:
-            shutil.copytree(legacy_runs, target_runs)
+            _parallel_copytree(legacy_runs, target_runs)
         except FileExistsError:
-            pass
-        else:
-            _rewrite_email_run_paths(target_runs)
+            _mark_migration_done(sentinel)
+            return
+        _rewrite_email_run_paths(target_runs)
+        _mark_migration_done(sentinel)
+    except Exception:
+        # Only a complete copy may be marked done; remove a partial tree so
+        # the next start retries instead of mistaking it for a finished one.
+        shutil.rmtree(target_runs, ignore_errors=True)
+    finally:
+        mark_legacy_migration_done()
 
 
-def _rewrite_email_run_paths(base_dir: Path) -> None:
+def _mark_migration_done(sentinel: Path) -> None:
     try:
+        sentinel.touch()
+    except OSError:
+        pass
+
+
+def _parallel_copytree(src: Path, dst: Path) -> None:
+    """Copy a directory tree, overlapping per-file copies on a thread pool.
+
+    Like shutil.copytree, raises FileExistsError when ``dst`` already exists.
+    Files are real copies, never hardlinks: the email ingest plugin rewrites
+    run configs and reports in place, which would otherwise also change the
+    legacy install's files.
+    """
+    dst.mkdir(parents=True)
+    directories: list[tuple[str, Path]] = []
+    files: list[tuple[str, Path]] = []
+    # Symlinked directories are copied by content, as shutil.copytree does;
+    # a directory already reached through another path is not walked again,
+    # so a link cycle cannot recurse forever.
+    visited = {os.path.realpath(src)}
+    for root, dirnames, filenames in os.walk(src, followlinks=True):
+        target_root = dst / os.path.relpath(root, src)
+        walk_next = []
+        for name in dirnames:
+            real_dir = os.path.realpath(os.path.join(root, name))
+            if real_dir in visited:
+                continue
+            visited.add(real_dir)
+            walk_next.append(name)
+            (target_root / name).mkdir(exist_ok=True)
+        dirnames[:] = walk_next
+        for name in filenames:
+            files.append((os.path.join(root, name), target_root / name))
+        directories.append((root, target_root))
+    if files:
+        workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="LegacyCopy") as pool:
+            for future in [pool.submit(_fast_copy2, source, target) for source, target in files]:
+                future.result()
+    for source_dir, target_dir in directories:
+        shutil.copystat(source_dir, target_dir)
+
+
+def _join_legacy_migration() -> None:
+    # A copy cut short at exit would leave a partial email_runs tree that the
+    # next start mistakes for a finished migration.
+    if _legacy_migration_thread is not None:
+        _legacy_migration_thread.join()
+
+
+@lru_cache(maxsize=None)
+def _yaml_codec() -> Optional[tuple[object, type, type]]:
+    """Import PyYAML on first use; it is only needed for legacy run migration.
+
+    Returns ``(yaml, Loader, Dumper)`` preferring the LibYAML-backed classes, or
+    None when PyYAML is not installed.
+    """
+    try:  # Optional dependency for rewriting legacy email run configs
         import yaml  # type: ignore
-    except ImportError:
+    except ImportError:  # pragma: no cover - handled at runtime
+        return None
+    return (
+        yaml,
+        getattr(yaml, "CSafeLoader", yaml.SafeLoader),
+        getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+    )
+
+
+# Below this many run dirs the thread pool costs more than it overlaps.
+_RUN_REWRITE_SERIAL_LIMIT = 4
+
+# Per-thread YAML emitter buffer, reused across fallback dumps.
+_DUMP_BUFFERS = threading.local()
+
+
+def _rewrite_email_run_paths(base_dir: Path) -> None:
+    codec = _yaml_codec()
+    if codec is None:
         return
-    for run_dir in base_dir.iterdir():
-        if not run_dir.is_dir():
-            continue
-        config_path = run_dir / "config.yaml"
-        if not config_path.exists():
-            continue
-        try:
-            data = yaml.safe_load(config_path.read_text(encoding="utf-8")) or {}
-        except Exception:
-            continue
-        shard_path = (run_dir / "shards").resolve()
-        summaries_path = (run_dir / "summaries").resolve()
-        data["shard_path"] = str(shard_path)
-        data["summaries_path"] = str(summaries_path)
+    # Resolve the base once; run dirs are plain (non-symlink) children of it.
+    base_real = os.path.realpath(base_dir)
+    with os.scandir(base_dir) as entries:
+        runs = [(entry.path, entry.name) for entry in entries if entry.is_dir(follow_symlinks=False)]
+    rewrite = partial(_rewrite_run_config, base_real, codec)
+    if len(runs) <= _RUN_REWRITE_SERIAL_LIMIT:
+        for run in runs:
+            rewrite(run)
+        return
+    # File I/O and LibYAML both release the GIL, so threads overlap per-run latency.
+    workers = min(8, os.cpu_count() or 4)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="RunRewrite") as pool:
+        for _ in pool.map(rewrite, runs):
+            pass
+
+
+def _rewrite_run_config(base_real: str, codec: tuple[object, type, type], run: tuple[str, str]) -> None:
+    yaml, loader, dumper = codec
+    run_path, name = run
+    config_path = Path(run_path, "config.yaml")
+    # Runs without a config simply fail the read; no separate exists() probe.
+    try:
+        raw = config_path.read_bytes()
+        text = raw.decode("utf-8")
+    except Exception:
+        return
+    join = os.path.join
+    paths = {
+        "shard_path": join(base_real, name, "shards"),
+        "summaries_path": join(base_real, name, "summaries"),
+    }
+    updated = _substitute_run_paths(text, paths)
+    if updated is None:
         try:
-            config_path.write_text(yaml.safe_dump(data, sort_keys=False), encoding="utf-8")
+            # LibYAML parses the undecoded bytes directly.
+            data = yaml.load(raw, Loader=loader) or {}
         except Exception:
-            continue
+            return
+        if not isinstance(data, dict):
+            return
+        if all(data.get(key) == value for key, value in paths.items()):
+            return
+        data.update(paths)
+        dump_buffer = getattr(_DUMP_BUFFERS, "buffer", None)
+        if dump_buffer is None:
+            dump_buffer = _DUMP_BUFFERS.buffer = io.BytesIO()
+        dump_buffer.seek(0)
+        dump_buffer.truncate()
+        yaml.dump(
+            data,
+            dump_buffer,
+            Dumper=dumper,
+            sort_keys=False,
+            default_flow_style=False,
+            encoding="utf-8",
+        )
+        payload = dump_buffer.getvalue()
+    elif updated == text:
+        return
+    else:
+        payload = updated.encode("utf-8")
+    try:
+        _replace_file_bytes(config_path, payload)
+    except Exception:
+        return
+
+
+def _replace_file_bytes(path: Path, payload: bytes) -> None:
+    """Atomically replace ``path`` with ``payload`` using raw fd writes.
+
+    Bytes go out untranslated, so a config keeps the line endings it was read with,
+    and the original file's permission bits are carried over to the replacement.
+    """
+    tmp_path = f"{path}.tmp"
+    original = _stat_or_none(path)
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0) | getattr(os, "O_CLOEXEC", 0)
+    fd = os.open(tmp_path, flags, 0o666)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    if original is not None:
+        os.chmod(tmp_path, stat.S_IMODE(original.st_mode))
+    os.replace(tmp_path, path)
+
+
+_RUN_PATH_LINE_RE = re.compile(r"^(shard_path|summaries_path):[ \t]*(.*?)[ \t\r]*$", re.MULTILINE)
+
+
+def _substitute_run_paths(text: str, paths: dict[str, str]) -> Optional[str]:
+    """Rewrite the top-level path keys of a run config without a YAML round-trip.
+
+    Returns None when the document does not have exactly one simple scalar line
+    per key, in which case the caller falls back to a full load/dump.
+    """
+    seen: dict[str, int] = {}
+    simple = True
+
+    def _replace(match: re.Match[str]) -> str:
+        nonlocal simple
+        key, raw = match.group(1), match.group(2)
+        seen[key] = seen.get(key, 0) + 1
+        if not raw or raw[0] in "|>&!*{[":
+            simple = False
+            return match.group(0)
+        target = paths[key]
+        quoted = json.dumps(target)
+        if raw in (target, quoted):
+            return match.group(0)
+        line = match.group(0)
+        offset = match.start(2) - match.start(0)
+        return line[:offset] + quoted + line[offset + len(raw):]
+
+    updated = _RUN_PATH_LINE_RE.sub(_replace, text)
+    if not simple or any(seen.get(key) != 1 for key in paths):
+        return None
+    return updated
 
 
 def main() -> None:
     data_root = ensure_user_data_dir()
+    # May hand off to the installed copy and exit; nothing else is built before it.
     _ensure_installed_binary(data_root)
     _migrate_legacy_data(data_root)
     settings_path = data_root / "settings.json"
-    settings = load_settings(settings_path)
     db_path = data_root / "assistant.db"
-    app = PersonalAssistantApp(db_path, data_root, settings, settings_path)
-    app.mainloop()
+    app = PersonalAssistantApp(db_path, data_root, load_settings(settings_path), settings_path)
+    try:
+        app.mainloop()
+    finally:
+        _join_legacy_migration()
 
 
 __all__ = ["main", "PersonalAssistantApp"]
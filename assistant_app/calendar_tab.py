@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import calendar as cal
+import heapq
 import json
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from textwrap import shorten
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from itertools import groupby
+from operator import itemgetter
 from datetime import datetime, timedelta, date, time as dt_time
 from pathlib import Path
 import tkinter as tk
@@ -17,8 +21,15 @@ from .models import Calendar, Event, EventOverride, ProductionCalendar
 from . import utils
 from .theme import ThemePalette
 from .time_widgets import TimeInput
+
+try:  # Optional dependency for faster import/export
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - handled at runtime
+    orjson = None  # type: ignore
 
 WEEKDAY_NAMES = ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
+_MONTH_GRID = cal.Calendar(firstweekday=cal.SUNDAY)
+_GRID_CELLS = 42
 REPEAT_OPTIONS = [
     ("None", "none"),
     ("Daily", "daily"),
@@ -28,6 +39,24 @@ REPEAT_OPTIONS = [
 ]
 
 CUSTOMIZED_OCCURRENCE_MARK = "\u270E"  # matches the calendar grid indicator
+
+# Expanded recurrences are keyed by the fields that drive the expansion, so an
+# edited event simply misses the cache; least recently used windows are evicted.
+_OCCURRENCE_CACHE_LIMIT = 4096
+_SEARCH_RESULT_LIMIT = 15
+_SEARCH_DEBOUNCE_MS = 120
+_REFRESH_DEBOUNCE_MS = 30
+# Below this many loaded events a scan of the cached titles beats a query.
+_SEARCH_INDEX_THRESHOLD = 1000
+
+
+@lru_cache(maxsize=12)
+def _month_grid_days(year: int, month: int) -> Tuple[Tuple[Optional[date], ...], Tuple[str, ...]]:
+    """Return the grid dates for a month padded to 42 cells, with their labels."""
+    days: List[Optional[date]] = [d for week in _MONTH_GRID.monthdatescalendar(year, month) for d in week]
+    days.extend([None] * (_GRID_CELLS - len(days)))
+    labels = tuple(str(d.day) if d is not None else "" for d in days)
+    return tuple(days), labels
 
 
 @dataclass
@@ -36,6 +65,11 @@ class DayCell:
     day_label: tk.Label
     events_container: tk.Frame
     date: Optional[date] = None
+    more_label: Optional[tk.Label] = None
+    more_visible: bool = False
+    colors: Optional[Tuple[str, str]] = None
+    event_labels: List[tk.Label] = field(default_factory=list)
+    visible_labels: int = 0
 
 
 @dataclass
@@ -54,13 +88,23 @@ class CalendarTab(ttk.Frame):
         self.current_month = datetime.now().date().replace(day=1)
         self.selected_day = datetime.now().date()
         self.production_calendars: List[ProductionCalendar] = []
+        self._prod_by_id: Dict[int, ProductionCalendar] = {}
+        self._prod_index_by_id: Dict[int, int] = {}
         self.current_production_id: Optional[int] = None
         self.calendars: List[Calendar] = []
         self.visible_calendar_ids: set[int] = set()
         self.events: List[Event] = []
         self.occurrences_by_day: Dict[date, List[Tuple[datetime, Event]]] = defaultdict(list)
+        self._occurrence_cache: "OrderedDict[tuple, List[datetime]]" = OrderedDict()
+        self._day_index: Dict[date, List[Tuple[datetime, Event]]] = {}
+        self._day_index_key: Optional[tuple] = None
+        self._day_index_events: Optional[List[Event]] = None
         self.calendar_vars: Dict[int, tk.BooleanVar] = {}
         self.day_cells: List[DayCell] = []
+        self._header_labels: List[tk.Label] = []
+        self._cell_tag = f"CalendarDayCell{id(self)}"
+        self._widget_to_cell_idx: Dict[str, int] = {}
+        self._event_label_entries: Dict[str, DayOccurrence] = {}
         self.selected_cell: Optional[DayCell] = None
         self._suspend_production_callback = False
         self._modal_overlay: tk.Frame | None = None
@@ -70,6 +114,7 @@ class CalendarTab(ttk.Frame):
         self.day_value_label: Optional[ttk.Label] = None
         self.day_events_tree: Optional[ttk.Treeview] = None
         self._day_occurrence_index: Dict[str, DayOccurrence] = {}
+        self._day_row_values: Dict[str, Tuple[str, str, str]] = {}
         self._calendar_checkbuttons: List[ttk.Checkbutton] = []
         self._calendar_edit_buttons: List[ttk.Button] = []
         self._interactive_buttons: List[tk.Widget] = []
@@ -80,6 +125,18 @@ class CalendarTab(ttk.Frame):
         self._search_popup: tk.Toplevel | None = None
         self._search_listbox: tk.Listbox | None = None
         self._search_result_events: List[Optional[Event]] = []
+        self._search_titles: List[Tuple[str, Event]] = []
+        self._search_titles_source: Optional[List[Event]] = None
+        self._search_pending: Optional[str] = None
+        self._search_entry_geom: Optional[Tuple[int, int, int]] = None
+        self._refresh_pending: Optional[str] = None
+        self._repaint_pending: Optional[str] = None
+        # Bumped whenever the loaded events (or anything drawn from them)
+        # change; together with the month and selection it decides whether
+        # the grid needs repainting at all.
+        self._events_version = 0
+        self._view_signature: Optional[tuple] = None
+        self._filters_signature: Optional[tuple] = None
 
         self._assign_palette_colors()
 
@@ -99,22 +156,41 @@ class CalendarTab(ttk.Frame):
         self.list_fg = palette.text_primary
         self.list_selected_bg = palette.list_selected_bg
         self.list_selected_fg = palette.list_selected_fg
+        self.border_color = palette.border
 
     def apply_theme(self, theme: ThemePalette) -> None:
+        # ttk widgets follow the shared style; only the raw tk widgets need recoloring.
         self.theme = theme
         self._assign_palette_colors()
-        self._build_ui()
-        self.refresh()
+        self._apply_palette_to_widgets()
+        self._update_production_color_patch()
+        self._populate_calendar(force=True)
+        self._rebuild_calendar_filters(force=True)
 
     def apply_time_format(self, use_24_hour: bool) -> None:
+        self._events_version += 1
         self.refresh()
 
     # ------------------------------------------------------------------ UI
-    def _build_ui(self) -> None:
-        self._destroy_search_popup()
-        for child in self.winfo_children():
-            child.destroy()
+    def _apply_palette_to_widgets(self) -> None:
+        self.production_color_patch.configure(bg=self.bg_color)
+        for header in self._header_labels:
+            header.configure(bg=self.bg_color, fg=self.secondary_text_color)
+        for cell in self.day_cells:
+            cell.colors = None
+            if cell.more_label is not None:
+                cell.more_label.configure(fg=self.secondary_text_color)
+        if self._search_listbox is not None:
+            self._search_listbox.configure(
+                bg=self.list_bg,
+                fg=self.list_fg,
+                selectbackground=self.list_selected_bg,
+                selectforeground=self.list_selected_fg,
+            )
+        if self._modal_overlay is not None:
+            self._modal_overlay.configure(bg=self.bg_color)
 
+    def _build_ui(self) -> None:
         selector = ttk.Frame(self)
         selector.pack(fill=tk.X, pady=(0, 12))
 
@@ -125,7 +201,10 @@ class CalendarTab(ttk.Frame):
 
         self.production_color_patch = tk.Canvas(selector, width=20, height=20, highlightthickness=0, bg=self.bg_color)
         self.production_color_patch.pack(side=tk.LEFT, padx=(12, 0))
-        self.production_color_patch.create_rectangle(0, 0, 20, 20, fill="#4F75FF", outline="")
+        self._production_patch_color = "#4F75FF"
+        self._production_patch_rect = self.production_color_patch.create_rectangle(
+            0, 0, 20, 20, fill=self._production_patch_color, outline=""
+        )
 
         ttk.Button(selector, text="New...", command=self.add_production_calendar).pack(side=tk.LEFT, padx=(12, 0))
         ttk.Button(selector, text="Edit...", command=self.edit_current_production_calendar).pack(side=tk.LEFT, padx=(6, 0))
@@ -198,14 +277,15 @@ class CalendarTab(ttk.Frame):
                 font=("Segoe UI", 10, "bold"),
             )
             header.grid(row=0, column=col, sticky="nsew", padx=1, pady=1)
+            self._header_labels.append(header)
 
-        # Create day cells (6x7)
-        self.day_cells = []
+        # Create day cells (6x7); one class binding serves every cell widget.
+        self.bind_class(self._cell_tag, "<Button-1>", self._on_cell_click_event)
+        self.bind_class(self._cell_tag, "<Double-1>", self._on_event_label_double_click)
         for row in range(6):
             for col in range(7):
                 frame = tk.Frame(grid_frame, bg=self.cell_bg, bd=0, highlightthickness=0)
                 frame.grid(row=row + 1, column=col, sticky="nsew", padx=1, pady=1)
-                frame.bind("<Button-1>", lambda e, idx=len(self.day_cells): self._on_cell_click(idx))
 
                 day_label = tk.Label(
                     frame,
@@ -218,12 +298,13 @@ class CalendarTab(ttk.Frame):
                     pady=4,
                 )
                 day_label.pack(fill=tk.X)
-                day_label.bind("<Button-1>", lambda e, idx=len(self.day_cells): self._on_cell_click(idx))
 
                 events_container = tk.Frame(frame, bg=self.cell_bg)
                 events_container.pack(fill=tk.BOTH, expand=True, padx=4, pady=(0, 4))
 
-                events_container.bind("<Button-1>", lambda e, idx=len(self.day_cells): self._on_cell_click(idx))
+                idx = len(self.day_cells)
+                for widget in (frame, day_label, events_container):
+                    self._attach_to_cell(widget, idx)
 
                 cell = DayCell(frame=frame, day_label=day_label, events_container=events_container)
                 self.day_cells.append(cell)
@@ -314,13 +395,25 @@ class CalendarTab(ttk.Frame):
         self._interactive_comboboxes = [self.production_combo]
         self._interactive_treeviews = [self.day_events_tree]
 
-        self.after(150, lambda: self._init_paned_position(paned))
+        # Place the sash on the first real <Configure>; polling is only a fallback.
+        self._paned = paned
+        self._paned_positioned = False
+        paned.bind("<Configure>", self._on_paned_configure, add="+")
+        self.after(200, self._init_paned_position)
+
+    def _on_paned_configure(self, event: tk.Event) -> None:
+        if not self._paned_positioned and event.width > 1:
+            self._init_paned_position()
 
-    def _init_paned_position(self, paned: ttk.Panedwindow) -> None:
+    def _init_paned_position(self) -> None:
+        if self._paned_positioned:
+            return
+        paned = self._paned
         width = paned.winfo_width()
         if width <= 1:
-            self.after(150, lambda: self._init_paned_position(paned))
+            self.after(16, self._init_paned_position)
             return
+        self._paned_positioned = True
         sidebar_min = 320
         left_min = 520
         ideal = int(width * 0.58)
@@ -334,16 +427,6 @@ class CalendarTab(ttk.Frame):
         except tk.TclError:
             pass
 
-    def _destroy_search_popup(self) -> None:
-        if self._search_popup is not None:
-            try:
-                self._search_popup.destroy()
-            except tk.TclError:
-                pass
-        self._search_popup = None
-        self._search_listbox = None
-        self._search_result_events = []
-
     def _create_search_bar(self, parent: tk.Widget) -> None:
         search_container = ttk.Frame(parent)
         search_container.pack(side=tk.LEFT, padx=(12, 0))
@@ -352,10 +435,11 @@ class CalendarTab(ttk.Frame):
         entry = ttk.Entry(search_container, textvariable=self.search_var, width=44)
         entry.pack(side=tk.LEFT)
         self.search_entry = entry
-        self.search_var.trace_add("write", lambda *_: self._update_search_results())
+        self.search_var.trace_add("write", lambda *_: self._schedule_search_update())
         entry.bind("<Escape>", lambda _: self._clear_search_results(clear_text=True))
         entry.bind("<Return>", lambda _: self._activate_first_search_result())
         entry.bind("<Down>", self._focus_search_results)
+        entry.bind("<Configure>", self._invalidate_search_geometry, add="+")
         entry.bind("<FocusOut>", lambda _: self.after(120, self._maybe_hide_search_popup))
         self._initialize_search_popup()
 
@@ -413,25 +497,54 @@ class CalendarTab(ttk.Frame):
     def _search_listbox_nav_down(self, event: tk.Event) -> None:
         return None
 
+    def _schedule_search_update(self) -> None:
+        # Coalesce fast typing so matching runs once the user pauses. The write
+        # trace (unlike <KeyRelease>) only fires on real edits, pastes included.
+        if self._search_pending is not None:
+            self.after_cancel(self._search_pending)
+        self._search_pending = self.after(_SEARCH_DEBOUNCE_MS, self._update_search_results)
+
+    def _flush_search_update(self) -> None:
+        if self._search_pending is not None:
+            self.after_cancel(self._search_pending)
+            self._update_search_results()
+
+    def _search_title_index(self) -> List[Tuple[str, Event]]:
+        if self._search_titles_source is not self.events:
+            self._search_titles = [((event.title or "").lower(), event) for event in self.events]
+            self._search_titles_source = self.events
+        return self._search_titles
+
+    def _search_events_index(self, query: str) -> Optional[List[Event]]:
+        if not self.db.supports_event_search or len(self.events) <= _SEARCH_INDEX_THRESHOLD:
+            return None
+        try:
+            return self.db.search_events(
+                query,
+                calendar_ids=self.visible_calendar_ids,
+                limit=_SEARCH_RESULT_LIMIT,
+            )
+        except Exception:
+            return None
+
     def _update_search_results(self) -> None:
+        self._search_pending = None
         if not self.search_var or not self.search_entry:
             return
         query = self.search_var.get().strip()
-        if not query:
+        key = query.lower()
+        if len(key) < 2:
             self._hide_search_popup()
             return
-        key = query.lower()
-        matches: List[Event] = []
-        seen_ids: set[int] = set()
-        for event in self.events:
-            if event.id in seen_ids:
-                continue
-            title = (event.title or "").lower()
-            if key in title:
-                matches.append(event)
-                seen_ids.add(event.id)
-            if len(matches) >= 15:
-                break
+        matches = self._search_events_index(query) if len(key) >= 3 else None
+        if matches is None:
+            # get_events returns one row per event id, so no de-duplication is needed.
+            matches = []
+            for title, event in self._search_title_index():
+                if key in title:
+                    matches.append(event)
+                    if len(matches) == _SEARCH_RESULT_LIMIT:
+                        break
         if not matches:
             self._populate_search_results([(None, f'No results for "{query}"')])
         else:
@@ -445,19 +558,23 @@ class CalendarTab(ttk.Frame):
         if not self._search_popup or not self._search_listbox or not self.search_entry:
             return
         self._search_listbox.delete(0, tk.END)
-        self._search_result_events = []
-        for event_obj, label in items:
-            self._search_listbox.insert(tk.END, label)
-            self._search_result_events.append(event_obj)
+        self._search_result_events = [event_obj for event_obj, _ in items]
+        if items:
+            self._search_listbox.insert(tk.END, *(label for _, label in items))
         count = len(items)
         if count == 0:
             self._hide_search_popup()
             return
         height_rows = max(1, min(count, 8))
         self._search_listbox.configure(height=height_rows)
-        entry_width = self.search_entry.winfo_width()
-        x = self.search_entry.winfo_rootx()
-        y = self.search_entry.winfo_rooty() + self.search_entry.winfo_height()
+        if self._search_entry_geom is None:
+            entry = self.search_entry
+            self._search_entry_geom = (
+                entry.winfo_width(),
+                entry.winfo_rootx(),
+                entry.winfo_rooty() + entry.winfo_height(),
+            )
+        entry_width, x, y = self._search_entry_geom
         self._search_popup.geometry(f"{entry_width}x{height_rows * 24}+{x}+{y}")
         self._search_popup.deiconify()
         self._search_popup.lift()
@@ -481,6 +598,7 @@ class CalendarTab(ttk.Frame):
             self.search_entry.icursor(tk.END)
 
     def _activate_first_search_result(self) -> None:
+        self._flush_search_update()
         if not self._search_listbox or not self._search_result_events:
             return
         if self._search_listbox.size() == 0:
@@ -488,7 +606,12 @@ class CalendarTab(ttk.Frame):
         self._search_listbox.selection_set(0)
         self._handle_search_result_click()
 
+    def _invalidate_search_geometry(self, event: Optional[tk.Event] = None) -> None:
+        self._search_entry_geom = None
+
     def _hide_search_popup(self) -> None:
+        # The window may move while the popup is hidden; measure again next time.
+        self._search_entry_geom = None
         if self._search_popup:
             self._search_popup.withdraw()
         if self._search_listbox:
@@ -505,12 +628,50 @@ class CalendarTab(ttk.Frame):
         self._hide_search_popup()
 
     # ---------------------------------------------------------------- Refresh
+    def _schedule_refresh(self) -> None:
+        # Several actions can fire back to back; only the last one rebuilds the tab.
+        if self._refresh_pending is not None:
+            try:
+                self.after_cancel(self._refresh_pending)
+            except tk.TclError:
+                pass
+        self._refresh_pending = self.after(_REFRESH_DEBOUNCE_MS, self._do_refresh)
+
+    def _do_refresh(self) -> None:
+        self._refresh_pending = None
+        self.refresh()
+
+    def _schedule_repaint(self) -> None:
+        # Redraw the grid from the already loaded events, coalescing bursts
+        # such as ticking several calendars in a row.
+        if self._repaint_pending is not None:
+            try:
+                self.after_cancel(self._repaint_pending)
+            except tk.TclError:
+                pass
+        self._repaint_pending = self.after(_REFRESH_DEBOUNCE_MS, self._do_repaint)
+
+    def _do_repaint(self) -> None:
+        self._repaint_pending = None
+        self._populate_calendar()
+        self._populate_day_events()
+
     def refresh(self) -> None:
+        for pending in (self._refresh_pending, self._repaint_pending):
+            if pending is not None:
+                try:
+                    self.after_cancel(pending)
+                except tk.TclError:
+                    pass
+        self._refresh_pending = None
+        self._repaint_pending = None
         self._load_production_calendars()
         if self.current_production_id is None:
             self.calendars = []
             self.visible_calendar_ids = set()
-            self.events = []
+            if self.events:
+                self.events = []
+                self._events_version += 1
             self.occurrences_by_day = defaultdict(list)
             self._populate_calendar()
             self._rebuild_calendar_filters()
@@ -532,9 +693,9 @@ class CalendarTab(ttk.Frame):
         except Exception:
             productions = []
         self.production_calendars = productions
-        if self.current_production_id is not None and not any(
-            pc.id == self.current_production_id for pc in productions
-        ):
+        self._prod_by_id = {pc.id: pc for pc in productions}
+        self._prod_index_by_id = {pc.id: idx for idx, pc in enumerate(productions)}
+        if self.current_production_id not in self._prod_by_id:
             self.current_production_id = None
         if productions and self.current_production_id is None:
             self.current_production_id = productions[0].id
@@ -551,11 +712,7 @@ class CalendarTab(ttk.Frame):
         if not hasattr(self, "production_combo"):
             return
         names = [pc.name for pc in self.production_calendars]
-        current_index = None
-        for idx, pc in enumerate(self.production_calendars):
-            if pc.id == self.current_production_id:
-                current_index = idx
-                break
+        current_index = self._prod_index_by_id.get(self.current_production_id)
         self._suspend_production_callback = True
         self.production_combo["values"] = names
         if current_index is not None:
@@ -573,12 +730,14 @@ class CalendarTab(ttk.Frame):
         if not hasattr(self, "production_color_patch"):
             return
         current = self._current_production()
-        color = current.color if current else self.theme.border
-        self.production_color_patch.delete("all")
-        self.production_color_patch.create_rectangle(0, 0, 20, 20, fill=color, outline="")
+        color = current.color if current else self.border_color
+        if color == self._production_patch_color:
+            return
+        self.production_color_patch.itemconfigure(self._production_patch_rect, fill=color)
+        self._production_patch_color = color
 
     def _current_production(self) -> Optional[ProductionCalendar]:
-        return next((pc for pc in self.production_calendars if pc.id == self.current_production_id), None)
+        return self._prod_by_id.get(self.current_production_id)
 
     def _set_modal_enabled(self, enabled: bool) -> None:
         state = tk.NORMAL if enabled else tk.DISABLED
@@ -598,11 +757,11 @@ class CalendarTab(ttk.Frame):
     def _on_production_selected(self, event: tk.Event) -> None:
         if self._suspend_production_callback:
             return
-        name = self.production_combo.get()
-        selected = next((pc for pc in self.production_calendars if pc.name == name), None)
+        index = self.production_combo.current()
+        selected = self.production_calendars[index] if 0 <= index < len(self.production_calendars) else None
         if selected and selected.id != self.current_production_id:
             self.current_production_id = selected.id
-            self.refresh()
+            self._schedule_refresh()
 
     def add_production_calendar(self) -> None:
         self._open_production_calendar_panel(None, allow_delete=False)
@@ -654,7 +813,7 @@ class CalendarTab(ttk.Frame):
             messagebox.showerror("Error", f"Could not save production calendar: {exc}", parent=self)
             return
         self._close_modal()
-        self.refresh()
+        self._schedule_refresh()
 
     def _handle_production_delete(self, production: Optional[ProductionCalendar]) -> None:
         if production is None:
@@ -695,14 +854,14 @@ class CalendarTab(ttk.Frame):
                 )
                 self._close_modal()
                 self.current_production_id = None
-                self.refresh()
+                self._schedule_refresh()
                 return
         except Exception as exc:
             messagebox.showerror("Error", f"Could not delete production calendar: {exc}", parent=self)
             return
         self._close_modal()
         self.current_production_id = None
-        self.refresh()
+        self._schedule_refresh()
 
     def export_current_production_calendar(self) -> None:
         production = self._current_production()
@@ -724,7 +883,12 @@ class CalendarTab(ttk.Frame):
             messagebox.showerror("Export Failed", str(exc), parent=self)
             return
         try:
-            Path(path).write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            if orjson is not None:
+                Path(path).write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+            else:
+                # Stream the encoder's chunks into the file instead of building one big string.
+                with open(path, "w", encoding="utf-8", buffering=1 << 16) as handle:
+                    json.dump(payload, handle, indent=2)
             messagebox.showinfo("Export Complete", f"Exported '{production.name}'.", parent=self)
         except Exception as exc:
             messagebox.showerror("Export Failed", str(exc), parent=self)
@@ -738,8 +902,11 @@ class CalendarTab(ttk.Frame):
         if not path:
             return
         try:
-            content = Path(path).read_text(encoding="utf-8")
-            payload = json.loads(content)
+            if orjson is not None:
+                payload = orjson.loads(Path(path).read_bytes())
+            else:
+                with open(path, "r", encoding="utf-8", buffering=1 << 16) as handle:
+                    payload = json.load(handle)
         except Exception as exc:
             messagebox.showerror("Import Failed", f"Could not read file: {exc}", parent=self)
             return
@@ -749,6 +916,7 @@ class CalendarTab(ttk.Frame):
             messagebox.showerror("Import Failed", str(exc), parent=self)
             return
         self.current_production_id = new_id
+        self._invalidate_occurrence_cache()
         self.refresh()
         messagebox.showinfo("Import Complete", "Production calendar imported successfully.", parent=self)
 
@@ -773,65 +941,63 @@ class CalendarTab(ttk.Frame):
 
     def _load_events(self) -> None:
         if not self.calendars:
-            self.events = []
+            if self.events:
+                self.events = []
+                self._events_version += 1
             return
         events = self.db.get_events(calendar_ids=self.visible_calendar_ids)
-        self.events = events
-
-    def _populate_calendar(self) -> None:
-        for cell in self.day_cells:
-            cell.date = None
-            cell.day_label.configure(text="", fg=self.text_color, bg=self.cell_bg)
-            for widget in cell.events_container.winfo_children():
-                widget.destroy()
-            cell.frame.configure(bg=self.cell_bg)
-            cell.events_container.configure(bg=self.cell_bg)
+        # Keep the existing list when nothing changed so the per-day index survives.
+        if events != self.events:
+            self.events = events
+            self._events_version += 1
 
+    def _populate_calendar(self, *, force: bool = False) -> None:
+        signature = (self.current_month, self.selected_day, self.current_production_id, self._events_version)
+        if not force and signature == self._view_signature:
+            return
+        self._view_signature = signature
         month_start = self.current_month
-        cal_obj = cal.Calendar(firstweekday=6)
-        weeks = cal_obj.monthdatescalendar(month_start.year, month_start.month)
+        days, day_texts = _month_grid_days(month_start.year, month_start.month)
         if self.month_label is not None:
             self.month_label.configure(text=month_start.strftime("%B %Y"))
         self.occurrences_by_day = defaultdict(list)
 
         if self.events:
-            start_dt = datetime.combine(weeks[0][0], datetime.min.time())
-            end_dt = datetime.combine(weeks[-1][-1], datetime.max.time())
-            overrides = self.db.get_event_overrides(
-                (event.id for event in self.events),
-                start_dt.date(),
-                end_dt.date(),
+            last_day = next(d for d in reversed(days) if d is not None)
+            start_dt = datetime.combine(days[0], datetime.min.time())
+            end_dt = datetime.combine(last_day, datetime.max.time())
+            day_index = self._expand_events_for_window(start_dt, end_dt)
+            # Only events that actually occur in the window can have overrides here.
+            event_ids = tuple({event.id for entries in day_index.values() for _, event in entries})
+            overrides = (
+                self.db.get_event_overrides(event_ids, start_dt.date(), end_dt.date()) if event_ids else {}
             )
-            for event in self.events:
-                for occurrence in event.occurrences_between(start_dt, end_dt):
-                    key = (event.id, occurrence.date())
-                    self.occurrences_by_day[occurrence.date()].append(
-                        DayOccurrence(
-                            occurrence=occurrence,
-                            event=event,
-                            override=overrides.get(key),
-                        )
+            for day, entries in day_index.items():
+                self.occurrences_by_day[day] = [
+                    DayOccurrence(
+                        occurrence=occurrence,
+                        event=event,
+                        override=overrides.get((event.id, day)),
                     )
-            for occs in self.occurrences_by_day.values():
-                occs.sort(key=lambda item: item.occurrence)
-
-        for idx, day in enumerate(d for week in weeks for d in week):
-            if idx >= len(self.day_cells):
-                break
-            cell = self.day_cells[idx]
-            cell.date = day
-            in_month = day.month == month_start.month
-            fg_color = self.text_color if in_month else self.outside_month_color
-            bg_color = self.cell_bg
-            cell.day_label.configure(text=str(day.day), fg=fg_color, bg=bg_color)
-            cell.frame.configure(bg=bg_color)
-            cell.events_container.configure(bg=bg_color)
+                    for occurrence, event in entries
+                ]
 
-            for widget in cell.events_container.winfo_children():
-                widget.destroy()
+        # The 6x7 cells are built once and reused; colors are applied by
+        # _highlight_selected_day, so only text, date and event rows change here.
+        # Event labels are pooled per cell: reconfigured when reused and
+        # pack_forget()-ed rather than destroyed when a day shows fewer events.
+        self._event_label_entries = {}
+        for idx, (cell, day, day_text) in enumerate(zip(self.day_cells, days, day_texts)):
+            if cell.date != day:
+                cell.date = day
+                cell.day_label.configure(text=day_text)
+            occurrences = self.occurrences_by_day.get(day, []) if day is not None else []
+            shown = occurrences[:4]
+            if cell.more_label is not None and cell.more_visible:
+                cell.more_label.pack_forget()
+                cell.more_visible = False
 
-            occurrences = self.occurrences_by_day.get(day, [])
-            for occ_entry in occurrences[:4]:
+            for position, occ_entry in enumerate(shown):
                 occurrence = occ_entry.occurrence
                 event = occ_entry.event
                 override = occ_entry.override
@@ -848,37 +1014,111 @@ class CalendarTab(ttk.Frame):
                 if self._is_customized_occurrence(occ_entry):
                     text += f" {CUSTOMIZED_OCCURRENCE_MARK}"
                 display_text = shorten(text, width=32, placeholder="...")
-                ev_label = tk.Label(
-                    cell.events_container,
-                    text=display_text,
-                    anchor="w",
-                    bg=label_bg,
-                    fg=fg,
-                    font=("Segoe UI", 9, "bold"),
-                    padx=4,
-                    pady=1,
-                )
-                ev_label.pack(fill=tk.X, pady=1)
-                ev_label.bind("<Button-1>", lambda e, date_obj=day: self.select_day(date_obj))
-                ev_label.bind("<Double-1>", lambda e, entry=occ_entry: self._open_occurrence_customizer(entry))
+                if position < len(cell.event_labels):
+                    ev_label = cell.event_labels[position]
+                    ev_label.configure(text=display_text, bg=label_bg, fg=fg)
+                else:
+                    ev_label = tk.Label(
+                        cell.events_container,
+                        text=display_text,
+                        anchor="w",
+                        bg=label_bg,
+                        fg=fg,
+                        font=("Segoe UI", 9, "bold"),
+                        padx=4,
+                        pady=1,
+                    )
+                    self._attach_to_cell(ev_label, idx)
+                    cell.event_labels.append(ev_label)
+                if position >= cell.visible_labels:
+                    ev_label.pack(fill=tk.X, pady=1)
+                self._event_label_entries[str(ev_label)] = occ_entry
+
+            for ev_label in cell.event_labels[len(shown):cell.visible_labels]:
+                ev_label.pack_forget()
+            cell.visible_labels = len(shown)
 
             if len(occurrences) > 4:
-                more_label = tk.Label(
-                    cell.events_container,
-                    text=f"+{len(occurrences) - 4}",
-                    anchor="w",
-                    bg=bg_color,
-                    fg=self.secondary_text_color,
-                    font=("Segoe UI", 9, "italic"),
-                )
-                more_label.pack(fill=tk.X, pady=1)
-                more_label.bind("<Button-1>", lambda e, date_obj=day: self.select_day(date_obj))
+                if cell.more_label is None:
+                    cell.more_label = tk.Label(
+                        cell.events_container,
+                        anchor="w",
+                        bg=cell.colors[0] if cell.colors else self.cell_bg,
+                        fg=self.secondary_text_color,
+                        font=("Segoe UI", 9, "italic"),
+                    )
+                    self._attach_to_cell(cell.more_label, idx)
+                cell.more_label.configure(text=f"+{len(occurrences) - 4}")
+                cell.more_label.pack(fill=tk.X, pady=1)
+                cell.more_visible = True
 
         self._highlight_selected_day()
 
-    def _rebuild_calendar_filters(self) -> None:
+    def _occurrences_for(self, event: Event, start_dt: datetime, end_dt: datetime) -> List[datetime]:
+        key = (
+            event.id,
+            event.start_time,
+            event.repeat,
+            event.repeat_interval,
+            event.repeat_until,
+            start_dt,
+            end_dt,
+        )
+        cache = self._occurrence_cache
+        cached = cache.get(key)
+        if cached is not None:
+            cache.move_to_end(key)
+            return cached
+        cached = event.occurrences_between(start_dt, end_dt)
+        cache[key] = cached
+        if len(cache) > _OCCURRENCE_CACHE_LIMIT:
+            cache.popitem(last=False)
+        return cached
+
+    def _expand_events_for_window(
+        self, start_dt: datetime, end_dt: datetime
+    ) -> Dict[date, List[Tuple[datetime, Event]]]:
+        key = (self.current_production_id, start_dt, end_dt)
+        if self._day_index_events is self.events and self._day_index_key == key:
+            return self._day_index
+        # Each event's occurrences are already ascending, so a k-way merge yields
+        # the window in order (ties keep event order) and groupby splits it by day.
+        per_event = [
+            [(occurrence, event) for occurrence in self._occurrences_for(event, start_dt, end_dt)]
+            for event in self.events
+            if self._may_occur_between(event, start_dt, end_dt)
+        ]
+        merged = heapq.merge(*per_event, key=itemgetter(0))
+        index = {day: list(entries) for day, entries in groupby(merged, key=lambda item: item[0].date())}
+        self._day_index = index
+        self._day_index_key = key
+        self._day_index_events = self.events
+        return index
+
+    @staticmethod
+    def _may_occur_between(event: Event, start_dt: datetime, end_dt: datetime) -> bool:
+        # Cheap bounds check so events that started later or ended earlier skip
+        # the cache lookup and expansion entirely.
+        if event.start_time > end_dt:
+            return False
+        if event.repeat == "none":
+            return event.start_time >= start_dt
+        return event.repeat_until is None or event.repeat_until >= start_dt
+
+    def _invalidate_occurrence_cache(self, event_id: Optional[int] = None) -> None:
+        if event_id is None:
+            self._occurrence_cache.clear()
+            return
+        for key in [key for key in self._occurrence_cache if key[0] == event_id]:
+            del self._occurrence_cache[key]
+
+    def _rebuild_calendar_filters(self, *, force: bool = False) -> None:
         if self.calendars_frame is None:
             return
+        signature = (tuple(self.calendars), frozenset(self.visible_calendar_ids))
+        if not force and signature == self._filters_signature:
+            return
+        self._filters_signature = signature
         for child in self.calendars_frame.winfo_children():
             child.destroy()
         self.calendar_vars.clear()
@@ -900,7 +1140,7 @@ class CalendarTab(ttk.Frame):
                 self.calendars_frame,
                 text=calendar_model.name,
                 variable=var,
-                command=lambda cid=calendar_model.id, v=var: self.toggle_calendar(cid, v.get()),
+                command=partial(self._on_calendar_filter_toggled, calendar_model.id),
             )
             check.grid(row=idx, column=1, sticky="w", pady=2)
             self._calendar_checkbuttons.append(check)
@@ -909,22 +1149,26 @@ class CalendarTab(ttk.Frame):
                 self.calendars_frame,
                 text="Edit",
                 width=6,
-                command=lambda cal=calendar_model: self.edit_calendar(cal),
+                command=partial(self.edit_calendar, calendar_model),
             )
             edit_btn.grid(row=idx, column=2, padx=(6, 0), pady=2, sticky="e")
             self._calendar_edit_buttons.append(edit_btn)
 
             self.calendar_vars[calendar_model.id] = var
 
+    def _on_calendar_filter_toggled(self, calendar_id: int) -> None:
+        var = self.calendar_vars.get(calendar_id)
+        if var is not None:
+            self.toggle_calendar(calendar_id, var.get())
+
     def _populate_day_events(self) -> None:
         tree = getattr(self, "day_events_tree", None)
         if tree is None:
             return
-        for item in tree.get_children():
-            tree.delete(item)
         day = self.selected_day
         occurrences = self.occurrences_by_day.get(day, [])
         self._day_occurrence_index = {}
+        rows: List[Tuple[str, Tuple[str, str, str]]] = []
         for occ_entry in occurrences:
             time_str = utils.format_time(occ_entry.occurrence)
             iid = f"{occ_entry.event.id}:{occ_entry.occurrence.isoformat()}"
@@ -935,14 +1179,23 @@ class CalendarTab(ttk.Frame):
             )
             if self._is_customized_occurrence(occ_entry):
                 title_text = f"{title_text} {CUSTOMIZED_OCCURRENCE_MARK}"
-            tree.insert(
-                "",
-                tk.END,
-                iid=iid,
-                values=(time_str, title_text, occ_entry.event.calendar_name),
-            )
+            rows.append((iid, (time_str, title_text, occ_entry.event.calendar_name)))
             self._day_occurrence_index[iid] = occ_entry
 
+        # Same occurrences as before (e.g. a refresh of the same day): update
+        # changed rows in place so the tree and its selection are kept.
+        existing = tree.get_children()
+        if existing == tuple(iid for iid, _ in rows):
+            for iid, values in rows:
+                if self._day_row_values.get(iid) != values:
+                    tree.item(iid, values=values)
+        else:
+            if existing:
+                tree.delete(*existing)
+            for iid, values in rows:
+                tree.insert("", tk.END, iid=iid, values=values)
+        self._day_row_values = dict(rows)
+
     def _is_customized_occurrence(self, occ_entry: DayOccurrence) -> bool:
         override = occ_entry.override
         if override is None:
@@ -966,15 +1219,19 @@ class CalendarTab(ttk.Frame):
     def _highlight_selected_day(self) -> None:
         if not self.day_cells:
             return
+        # Cells remember the colors last applied, so only cells whose state
+        # changed (typically the old and new selection) are reconfigured.
         for cell in self.day_cells:
             bg = self.cell_selected_bg if cell.date == self.selected_day else self.cell_bg
             fg = self.text_color if cell.date and cell.date.month == self.current_month.month else self.outside_month_color
+            if cell.colors == (bg, fg):
+                continue
+            cell.colors = (bg, fg)
             cell.frame.configure(bg=bg)
             cell.day_label.configure(bg=bg, fg=fg)
             cell.events_container.configure(bg=bg)
-            for child in cell.events_container.winfo_children():
-                if isinstance(child, tk.Label) and child.cget("text").startswith("+"):
-                    child.configure(bg=bg)
+            if cell.more_label is not None:
+                cell.more_label.configure(bg=bg)
 
     def _update_selected_day_label(self) -> None:
         label = getattr(self, "day_value_label", None)
@@ -983,6 +1240,20 @@ class CalendarTab(ttk.Frame):
         label.configure(text=self.selected_day.strftime("%A, %B %d, %Y"))
 
     # ---------------------------------------------------------------- Events
+    def _attach_to_cell(self, widget: tk.Widget, index: int) -> None:
+        widget.bindtags((self._cell_tag,) + widget.bindtags())
+        self._widget_to_cell_idx[str(widget)] = index
+
+    def _on_event_label_double_click(self, event: tk.Event) -> None:
+        occ_entry = self._event_label_entries.get(str(event.widget))
+        if occ_entry is not None:
+            self._open_occurrence_customizer(occ_entry)
+
+    def _on_cell_click_event(self, event: tk.Event) -> None:
+        index = self._widget_to_cell_idx.get(str(event.widget))
+        if index is not None:
+            self._on_cell_click(index)
+
     def _on_cell_click(self, index: int) -> None:
         if index >= len(self.day_cells):
             return
@@ -1005,27 +1276,48 @@ class CalendarTab(ttk.Frame):
             self.db.update_calendar(calendar_id, is_visible=visible)
         except Exception:
             pass
-        self.refresh()
+        if not self.visible_calendar_ids:
+            # _load_calendars decides which calendar stays visible; let it run.
+            self._schedule_refresh()
+            return
+        # Only one calendar's events change, so adjust the loaded list rather
+        # than reloading productions, calendars and every event.
+        if visible:
+            try:
+                added = self.db.get_events(calendar_ids=[calendar_id])
+            except Exception:
+                self._schedule_refresh()
+                return
+            events = [ev for ev in self.events if ev.calendar_id != calendar_id] + added
+            events.sort(key=lambda ev: ev.start_time)
+        else:
+            events = [ev for ev in self.events if ev.calendar_id != calendar_id]
+        # A calendar with no events leaves the grid as it is.
+        if events != self.events:
+            self.events = events
+            self._events_version += 1
+        self._clear_search_results()
+        self._schedule_repaint()
 
     def go_to_previous_month(self) -> None:
         prev_month = utils.add_months(datetime.combine(self.current_month, datetime.min.time()), -1).date()
         self.current_month = prev_month.replace(day=1)
         if self.selected_day.month != self.current_month.month:
             self.selected_day = self.current_month
-        self.refresh()
+        self._schedule_refresh()
 
     def go_to_next_month(self) -> None:
         next_month = utils.add_months(datetime.combine(self.current_month, datetime.min.time()), 1).date()
         self.current_month = next_month.replace(day=1)
         if self.selected_day.month != self.current_month.month:
             self.selected_day = self.current_month
-        self.refresh()
+        self._schedule_refresh()
 
     def go_to_today(self) -> None:
         today = datetime.now().date()
         self.current_month = today.replace(day=1)
         self.selected_day = today
-        self.refresh()
+        self._schedule_refresh()
 
     def open_recap_dialog(self) -> None:
         production = self._current_production()
@@ -1320,19 +1612,27 @@ class CalendarTab(ttk.Frame):
         if not entries:
             lines.append("No manual schedule items found in this range.")
             return "\n".join(lines)
+        description_blocks: Dict[int, List[str]] = {}
         for index, (occurrence, end_time, event, _override) in enumerate(entries, start=1):
             start_str = utils.format_datetime(occurrence)
             end_str = utils.format_datetime(end_time)
             lines.append(f"{index}. {start_str} - {end_str} | {event.calendar_name} | {event.title}")
-            description = (event.description or "").strip()
-            if description:
-                for desc_line in description.splitlines():
-                    lines.append(f"   {desc_line}")
+            lines.extend(self._description_block(event, description_blocks))
             lines.append("")
         if lines[-1] == "":
             lines.pop()
         return "\n".join(lines)
 
+    @staticmethod
+    def _description_block(event: Event, cache: Dict[int, List[str]]) -> List[str]:
+        # Recurring events repeat the same description on every occurrence.
+        block = cache.get(event.id)
+        if block is None:
+            description = (event.description or "").strip()
+            block = [f"   {desc_line}" for desc_line in description.splitlines()]
+            cache[event.id] = block
+        return block
+
     def _format_recap_report(
         self,
         entries: List[Tuple[datetime, datetime, Event]],
@@ -1351,14 +1651,12 @@ class CalendarTab(ttk.Frame):
         if not entries:
             lines.append("No scheduled items in this range.")
             return "\n".join(lines)
+        description_blocks: Dict[int, List[str]] = {}
         for index, (occurrence, end_time, event) in enumerate(entries, start=1):
             start_str = utils.format_datetime(occurrence)
             end_str = utils.format_datetime(end_time)
             lines.append(f"{index}. {start_str} - {end_str} | {event.calendar_name} | {event.title}")
-            description = (event.description or "").strip()
-            if description:
-                for desc_line in description.splitlines():
-                    lines.append(f"   {desc_line}")
+            lines.extend(self._description_block(event, description_blocks))
             lines.append("")
         if lines[-1] == "":
             lines.pop()
@@ -1424,6 +1722,7 @@ class CalendarTab(ttk.Frame):
             messagebox.showerror("Customize Event", f"Could not save customization: {exc}", parent=self)
             return
         self._close_modal()
+        self._events_version += 1
         self.refresh()
         self.select_day(occurrence_date)
 
@@ -1434,6 +1733,7 @@ class CalendarTab(ttk.Frame):
             messagebox.showerror("Customize Event", f"Could not clear customization: {exc}", parent=self)
             return
         self._close_modal()
+        self._events_version += 1
         self.refresh()
         self.select_day(occurrence_date)
 
@@ -1466,6 +1766,8 @@ class CalendarTab(ttk.Frame):
         except Exception as exc:
             messagebox.showerror("Error", f"Could not save event: {exc}", parent=self)
             return
+        if event is not None:
+            self._invalidate_occurrence_cache(event.id)
         self._close_modal()
         self.refresh()
         if reselect_id is not None:
@@ -1487,6 +1789,7 @@ class CalendarTab(ttk.Frame):
             return
         if messagebox.askyesno("Delete Event", f"Delete '{occ_entry.event.title}' from all future occurrences?"):
             self.db.delete_event(occ_entry.event.id)
+            self._invalidate_occurrence_cache(occ_entry.event.id)
             self.refresh()
             self.select_day(self.selected_day)
 
@@ -1556,7 +1859,7 @@ class CalendarTab(ttk.Frame):
             messagebox.showerror("Error", f"Could not save calendar: {exc}", parent=self)
             return
         self._close_modal()
-        self.refresh()
+        self._schedule_refresh()
 
     def _handle_calendar_delete(self, cal: Optional[Calendar]) -> None:
         if cal is None:
@@ -1573,8 +1876,9 @@ class CalendarTab(ttk.Frame):
         except Exception as exc:
             messagebox.showerror("Error", f"Could not delete calendar: {exc}", parent=self)
             return
+        self._invalidate_occurrence_cache()
         self._close_modal()
-        self.refresh()
+        self._schedule_refresh()
 
 
 class CalendarEditorPanel(tk.Frame):
@@ -116,6 +116,7 @@ class Database:
             self._ensure_issue_calendar_schema()
             self._ensure_production_log_schema()
             self._ensure_export_validator_schema()
+            self._ensure_event_search_schema()
 
     def _ensure_column(self, table: str, column: str, definition: str) -> None:
         existing = {
@@ -648,6 +649,63 @@ class Database:
         )
         self._conn.commit()
 
+    _EVENT_SEARCH_TRIGGERS = ("events_fts_ai", "events_fts_ad", "events_fts_au")
+
+    def _ensure_event_search_schema(self) -> None:
+        # Trigram FTS5 index over event titles for substring search. Builds of
+        # SQLite without FTS5 (or older than 3.34) fall back to in-memory search.
+        self.supports_event_search = False
+        created = not self._table_exists("events_fts")
+        try:
+            self._conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS events_fts USING fts5("
+                "title, content='events', content_rowid='id', tokenize='trigram')"
+            )
+            # Opening an existing table is what loads the tokenizer, so this
+            # also catches a database created by a build that had trigram.
+            self._conn.execute("SELECT rowid FROM events_fts LIMIT 0")
+        except sqlite3.OperationalError:
+            self._drop_event_search_triggers()
+            return
+        existing = {
+            row["name"]
+            for row in self._conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+        }
+        # Triggers dropped by such a build leave the index stale; rebuild it.
+        stale = created or not existing.issuperset(self._EVENT_SEARCH_TRIGGERS)
+        try:
+            self._conn.executescript(
+                """
+                CREATE TRIGGER IF NOT EXISTS events_fts_ai AFTER INSERT ON events BEGIN
+                    INSERT INTO events_fts(rowid, title) VALUES (new.id, new.title);
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS events_fts_ad AFTER DELETE ON events BEGIN
+                    INSERT INTO events_fts(events_fts, rowid, title) VALUES ('delete', old.id, old.title);
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS events_fts_au AFTER UPDATE OF title ON events BEGIN
+                    INSERT INTO events_fts(events_fts, rowid, title) VALUES ('delete', old.id, old.title);
+                    INSERT INTO events_fts(rowid, title) VALUES (new.id, new.title);
+                END;
+                """
+            )
+            if stale:
+                self._conn.execute("INSERT INTO events_fts(events_fts) VALUES ('rebuild')")
+        except sqlite3.OperationalError:
+            self._drop_event_search_triggers()
+            return
+        self._conn.commit()
+        self.supports_event_search = True
+
+    def _drop_event_search_triggers(self) -> None:
+        # Left in place, the sync triggers would make every write to events
+        # fail on a build that cannot open events_fts.
+        self._conn.rollback()
+        for name in self._EVENT_SEARCH_TRIGGERS:
+            self._conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+        self._conn.commit()
+
     def _ensure_export_validator_schema(self) -> None:
         self._conn.executescript(
             """
@@ -1219,6 +1277,21 @@ class Database:
                 "SELECT id, name, color, is_visible FROM calendars WHERE production_calendar_id = ? ORDER BY name",
                 (production_calendar_id,),
             ).fetchall()
+            # One query for every override in the production instead of one per event.
+            overrides_by_event: Dict[int, List[sqlite3.Row]] = {}
+            for ovr in self._conn.execute(
+                """
+                SELECT o.event_id, o.occurrence_date, o.title, o.description, o.calendar_color, o.note,
+                       o.manual_schedule
+                FROM event_overrides o
+                JOIN events e ON e.id = o.event_id
+                JOIN calendars c ON c.id = e.calendar_id
+                WHERE c.production_calendar_id = ?
+                ORDER BY o.event_id, o.occurrence_date
+                """,
+                (production_calendar_id,),
+            ):
+                overrides_by_event.setdefault(ovr["event_id"], []).append(ovr)
             payload_calendars: List[dict[str, object]] = []
             for cal_row in calendars:
                 events = self._conn.execute(
@@ -1240,15 +1313,7 @@ class Database:
                     }
                 )
                 for event_row in events:
-                    overrides = self._conn.execute(
-                          """
-                          SELECT occurrence_date, title, description, calendar_color, note, manual_schedule
-                          FROM event_overrides
-                          WHERE event_id = ?
-                          ORDER BY occurrence_date
-                          """,
-                          (event_row["id"],),
-                    ).fetchall()
+                    overrides = overrides_by_event.get(event_row["id"], [])
                     payload_calendars[-1]["events"].append(
                         {
                             "title": event_row["title"],
@@ -1498,26 +1563,60 @@ class Database:
         query += " ORDER BY e.start_time"
         with self._lock:
             rows = self._conn.execute(query, params).fetchall()
-        events: List[Event] = []
-        for row in rows:
-            events.append(
-                Event(
-                    id=row["id"],
-                    calendar_id=row["calendar_id"],
-                    calendar_name=row["calendar_name"],
-                    calendar_color=row["calendar_color"],
-                    title=row["title"],
-                    description=row["description"] or "",
-                    start_time=datetime.fromisoformat(row["start_time"]),
-                    duration_minutes=row["duration_minutes"],
-                    repeat=row["repeat"],
-                    repeat_interval=row["repeat_interval"],
-                    repeat_until=utils.from_iso(row["repeat_until"]),
-                    reminder_minutes_before=row["reminder_minutes_before"],
-                    manual_schedule=bool(row["manual_schedule"]),
-                )
-            )
-        return events
+        return [self._event_from_row(row) for row in rows]
+
+    def search_events(
+        self,
+        text: str,
+        calendar_ids: Optional[Iterable[int]] = None,
+        limit: int = 15,
+    ) -> List[Event]:
+        """Return events whose title contains ``text`` using the trigram index.
+
+        Trigram matching needs at least three characters; callers should check
+        ``supports_event_search`` and fall back to their own scan otherwise.
+        An empty ``calendar_ids`` matches nothing; pass None to search all.
+        """
+        if calendar_ids is not None:
+            calendar_ids = list(calendar_ids)
+            if not calendar_ids:
+                return []
+        query = (
+            "SELECT e.id, e.calendar_id, c.name AS calendar_name, c.color AS calendar_color, "
+            "e.title, e.description, e.start_time, e.duration_minutes, e.repeat, e.repeat_interval, "
+            "e.repeat_until, e.reminder_minutes_before, e.manual_schedule "
+            "FROM events_fts JOIN events e ON e.id = events_fts.rowid "
+            "JOIN calendars c ON e.calendar_id = c.id "
+            "WHERE events_fts MATCH ?"
+        )
+        params: List[object] = ['"' + text.replace('"', '""') + '"']
+        if calendar_ids is not None:
+            placeholders = ",".join("?" for _ in calendar_ids)
+            query += f" AND e.calendar_id IN ({placeholders})"
+            params.extend(calendar_ids)
+        query += " ORDER BY e.start_time LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [self._event_from_row(row) for row in rows]
+
+    @staticmethod
+    def _event_from_row(row: sqlite3.Row) -> Event:
+        return Event(
+            id=row["id"],
+            calendar_id=row["calendar_id"],
+            calendar_name=row["calendar_name"],
+            calendar_color=row["calendar_color"],
+            title=row["title"],
+            description=row["description"] or "",
+            start_time=datetime.fromisoformat(row["start_time"]),
+            duration_minutes=row["duration_minutes"],
+            repeat=row["repeat"],
+            repeat_interval=row["repeat_interval"],
+            repeat_until=utils.from_iso(row["repeat_until"]),
+            reminder_minutes_before=row["reminder_minutes_before"],
+            manual_schedule=bool(row["manual_schedule"]),
+        )
 
     def get_event_overrides(
         self,
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 import sys
+import threading
 from pathlib import Path
 from typing import Optional
 
@@ -49,6 +50,27 @@ def legacy_project_root() -> Path:
     return Path(__file__).resolve().parent.parent
 
 
+# Cleared while legacy email runs are copied into the user data directory in
+# the background; anything that creates email_runs must wait for it.
+_LEGACY_RUNS_READY = threading.Event()
+_LEGACY_RUNS_READY.set()
+
+
+def mark_legacy_migration_pending() -> None:
+    _LEGACY_RUNS_READY.clear()
+
+
+def mark_legacy_migration_done() -> None:
+    _LEGACY_RUNS_READY.set()
+
+
+def legacy_migration_ready() -> bool:
+    """
+    Return True when no background legacy email_runs migration is running.
+    """
+    return _LEGACY_RUNS_READY.is_set()
+
+
 def get_update_repo() -> Optional[str]:
     """
     Return the GitHub repository (owner/name) used for release checks.
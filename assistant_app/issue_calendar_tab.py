@@ -16,6 +16,7 @@ from . import utils
 from .theme import ThemePalette
 
 WEEKDAY_NAMES = ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
+_MONTH_GRID = cal.Calendar(firstweekday=cal.SUNDAY)
 
 
 @dataclass
@@ -319,8 +320,7 @@ class IssueCalendarTab(ttk.Frame):
 
     def _populate_calendar(self) -> None:
         month_start = self.current_month
-        cal_obj = cal.Calendar(firstweekday=6)
-        weeks = cal_obj.monthdatescalendar(month_start.year, month_start.month)
+        weeks = _MONTH_GRID.monthdatescalendar(month_start.year, month_start.month)
 
         if self.month_label:
             self.month_label.configure(text=month_start.strftime("%B %Y"))
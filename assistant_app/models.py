@@ -61,6 +61,14 @@ class Event:
         current = self._first_occurrence_at_or_after(window_start)
         if current is None:
             return []
+        step = self._fixed_step()
+        if step is not None:
+            # Fixed-length steps: count the occurrences and build them directly.
+            last = min(window_end, repeat_until)
+            if current > last:
+                return []
+            count = (last - current) // step + 1
+            return [current + step * index for index in range(count)]
         while current <= window_end and current <= repeat_until:
             occurrences.append(current)
             next_occurrence = self._advance(current)
@@ -97,16 +105,33 @@ class Event:
             return self.start_time + timedelta(minutes=steps * interval_minutes)
         if self.repeat == "monthly":
             current = self.start_time
+            if current.day <= 28 and self.repeat_interval > 0:
+                # No month is shorter than 28 days, so the day never clamps and
+                # whole intervals can be skipped in one jump.
+                months = (target.year - current.year) * 12 + target.month - current.month
+                current = utils.add_months(current, months // self.repeat_interval * self.repeat_interval)
             while current < target:
                 current = self._advance(current)
             return current
         if self.repeat == "yearly":
             current = self.start_time
+            if (current.month, current.day) != (2, 29) and self.repeat_interval > 0:
+                years = target.year - current.year
+                current = utils.add_years(current, years // self.repeat_interval * self.repeat_interval)
             while current < target:
                 current = self._advance(current)
             return current
         return None
 
+    def _fixed_step(self) -> Optional[timedelta]:
+        if self.repeat_interval <= 0:
+            return None
+        if self.repeat == "daily":
+            return timedelta(days=self.repeat_interval)
+        if self.repeat == "weekly":
+            return timedelta(weeks=self.repeat_interval)
+        return None
+
     def _advance(self, current: datetime) -> datetime:
         if self.repeat == "daily":
             return current + timedelta(days=self.repeat_interval)
@@ -37,6 +37,8 @@ class ScrumTab(ttk.Frame):
         self._modal_overlay: Optional[tk.Frame] = None
         self._modal_panel: Optional[tk.Frame] = None
         self._active_canvas: Optional[tk.Canvas] = None
+        # Wheel events are routed through a bindtag carried only by board widgets.
+        self._wheel_tag = f"ScrumWheel{id(self)}"
         self._configure_styles()
         self.base_bg = self.theme.card_bg
         self._drag_preview: Optional[tk.Toplevel] = None
@@ -172,6 +174,7 @@ class ScrumTab(ttk.Frame):
         for widget in (canvas, frame):
             widget.bind("<Enter>", handle_enter, add="+")
             widget.bind("<Leave>", handle_leave, add="+")
+            self._add_wheel_tag(widget)
 
     def _register_card_scroll(self, card: "ScrumCard", canvas: tk.Canvas) -> None:
         def handle_enter(_: tk.Event, cv: tk.Canvas = canvas) -> None:
@@ -180,11 +183,22 @@ class ScrumTab(ttk.Frame):
         card.bind("<Enter>", handle_enter, add="+")
         for child in card.winfo_children():
             child.bind("<Enter>", handle_enter, add="+")
+        self._add_wheel_tag(card, recursive=True)
+
+    def _add_wheel_tag(self, widget: tk.Misc, recursive: bool = False) -> None:
+        tags = widget.bindtags()
+        if self._wheel_tag not in tags:
+            # Sit just before "all" so class bindings (e.g. Text scrolling) still run first.
+            index = tags.index("all") if "all" in tags else len(tags)
+            widget.bindtags(tags[:index] + (self._wheel_tag,) + tags[index:])
+        if recursive:
+            for child in widget.winfo_children():
+                self._add_wheel_tag(child, recursive=True)
 
     def _bind_mousewheel_support(self) -> None:
-        self.bind_all("<MouseWheel>", self._on_mousewheel, add="+")
-        self.bind_all("<Button-4>", self._on_mousewheel_up, add="+")
-        self.bind_all("<Button-5>", self._on_mousewheel_down, add="+")
+        self.bind_class(self._wheel_tag, "<MouseWheel>", self._on_mousewheel)
+        self.bind_class(self._wheel_tag, "<Button-4>", self._on_mousewheel_up)
+        self.bind_class(self._wheel_tag, "<Button-5>", self._on_mousewheel_down)
 
     def _set_active_canvas(self, canvas: Optional[tk.Canvas]) -> None:
         self._active_canvas = canvas
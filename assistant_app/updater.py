@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
 import os
 import shutil
 import subprocess
@@ -9,7 +9,7 @@ import sys
 import tempfile
 import urllib.error
 import urllib.request
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Callable, Optional
 
@@ -65,6 +65,7 @@ def check_for_update(current_version: str) -> Optional[AvailableUpdate]:
     latest_version = tag.lstrip("v")
     if not _is_remote_newer(latest_version, current_version):
         _python_log(f"No update available. Remote={latest_version}, current={current_version}.")
+        _store_cached_update(None)
         return None
 
     asset_name = get_update_asset_name()
@@ -72,21 +73,52 @@ def check_for_update(current_version: str) -> Optional[AvailableUpdate]:
     if not asset_url:
         raise UpdateError(f"Latest release is missing an asset named {asset_name!r}.")
     _python_log(f"Update available: version {latest_version}, asset {asset_name}.")
-    return AvailableUpdate(
+    update = AvailableUpdate(
         version=latest_version,
         notes=str(data.get("body") or ""),
         asset_url=asset_url,
         asset_name=asset_name,
         release_name=str(data.get("name") or tag),
     )
+    _store_cached_update(update)
+    return update
+
+
+def load_cached_update(current_version: str) -> Optional[AvailableUpdate]:
+    """Return the update found by the last successful check, if it is recent and still newer.
+
+    This lets startup prompt immediately while ``check_for_update`` refreshes
+    the answer in the background; network failures leave the cache untouched.
+    """
+    try:
+        data = json.loads(_UPDATE_CACHE_PATH.read_text(encoding="utf-8"))
+        checked_at = datetime.fromisoformat(str(data["checked_at"]))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if datetime.now() - checked_at > UPDATE_CACHE_TTL:
+        return None
+    cached = data.get("update")
+    if not isinstance(cached, dict):
+        return None
+    try:
+        update = AvailableUpdate(**cached)
+    except TypeError:
+        return None
+    if not _is_remote_newer(update.version, current_version):
+        return None
+    return update
 
 
 ProgressCallback = Callable[[int, int], None]
 
+# Answers older than this are not trusted for the startup prompt.
+UPDATE_CACHE_TTL = timedelta(days=1)
+
 
 # --------------------------------------------------------------------------- logging helpers
 
-_LOG_DIR = ensure_user_data_dir() / "Logs"
+_DATA_DIR = ensure_user_data_dir()
+_LOG_DIR = _DATA_DIR / "Logs"
 _LOG_DIR.mkdir(parents=True, exist_ok=True)
 _PYTHON_LOG_PATH = _LOG_DIR / f"pa-update-python-{datetime.now():%Y%m%d-%H%M%S-%f}.log"
 
@@ -97,6 +129,29 @@ def _python_log(message: str) -> None:
         handle.write(f"{timestamp} {message}\n")
 
 
+def log_update_error(context: str, exc: BaseException) -> None:
+    """Record an update failure that has no UI to report it."""
+    _python_log(f"{context}: {type(exc).__name__}: {exc}")
+
+
+# --------------------------------------------------------------------------- update-check cache
+
+_UPDATE_CACHE_PATH = _DATA_DIR / "update_check.json"
+
+
+def _store_cached_update(update: Optional[AvailableUpdate]) -> None:
+    payload = {
+        "checked_at": datetime.now().isoformat(timespec="seconds"),
+        "update": asdict(update) if update is not None else None,
+    }
+    tmp_path = _UPDATE_CACHE_PATH.with_suffix(".tmp")
+    try:
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp_path, _UPDATE_CACHE_PATH)
+    except OSError as exc:
+        _python_log(f"Failed to write update-check cache: {exc}")
+
+
 def prepare_and_schedule_restart(update: AvailableUpdate, progress: Optional[ProgressCallback] = None) -> None:
     executable = _current_executable()
     if executable is None:
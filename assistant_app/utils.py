@@ -37,8 +37,13 @@ def format_datetime(
     date_format: str = "%Y-%m-%d",
     include_seconds: bool = False,
 ) -> str:
+    use_24 = _USE_24_HOUR_TIME if use_24_hour is None else use_24_hour
+    if use_24:
+        # 24-hour times need no zero stripping, so one strftime covers both parts.
+        fmt = "%H:%M:%S" if include_seconds else "%H:%M"
+        return value.strftime(f"{date_format} {fmt}").strip()
     date_part = value.strftime(date_format)
-    time_part = format_time(value, use_24_hour, include_seconds=include_seconds)
+    time_part = format_time(value, use_24, include_seconds=include_seconds)
     return f"{date_part} {time_part}".strip()
 
 